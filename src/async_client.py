@@ -20,15 +20,18 @@ class APIResponse:
 class AsyncAPIClient:
     """Example async API client that we'll test"""
     
-    def __init__(self, base_url: str, timeout: int = 30):
+    def __init__(self, base_url: str, timeout: int = 30,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
         self.base_url = base_url
         self.timeout = timeout
+        self.transport = transport
         self._session: Optional[httpx.AsyncClient] = None
     
     async def __aenter__(self):
         self._session = httpx.AsyncClient(
             base_url=self.base_url,
-            timeout=self.timeout
+            timeout=self.timeout,
+            transport=self.transport
         )
         return self
     
@@ -4,6 +4,7 @@ Contains configurations for different test environments (development, staging, p
 """
 import os
 from enum import Enum
+from functools import lru_cache
 from dataclasses import dataclass
 
 class Environment(Enum):
@@ -29,6 +30,7 @@ ENVIRONMENT_CONFIGS = {
     Environment.PROD: EnvironmentConfig(base_url="https://api.example.com", timeout=20),
 }
 
+@lru_cache(maxsize=None)
 def get_environment_config(env_name: str) -> EnvironmentConfig:
     """Get the configuration for a given environment name."""
     env = Environment(env_name)
@@ -7,12 +7,20 @@ import jsonschema
 from openapi_spec_validator import validate_spec
 from openapi_spec_validator.readers import read_from_filename
 
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:  # libyaml not available: pure-Python loader
+    from yaml import SafeLoader as YamlSafeLoader
+
+SCHEMA_REF_PREFIX = '#/components/schemas/'
+
 class OpenAPIClient:
     """HTTP client with OpenAPI schema validation"""
     
-    def __init__(self, base_url: str, spec_url: str = None, spec_file: str = None):
+    def __init__(self, base_url: str, spec_url: str = None, spec_file: str = None,
+                 transport: Optional[httpx.BaseTransport] = None):
         self.base_url = base_url
-        self.client = httpx.Client(base_url=base_url, timeout=30.0)
+        self.client = httpx.Client(base_url=base_url, timeout=30.0, transport=transport)
         self.spec = None
         self.schemas = {}
         
@@ -34,7 +42,7 @@ class OpenAPIClient:
         spec_path = Path(spec_file)
         if spec_path.suffix.lower() in ['.yaml', '.yml']:
             with open(spec_path, 'r') as f:
-                self.spec = yaml.safe_load(f)
+                self.spec = yaml.load(f, Loader=YamlSafeLoader)
         else:
             with open(spec_path, 'r') as f:
                 self.spec = json.load(f)
@@ -151,8 +159,8 @@ class OpenAPIClient:
         """Resolve schema references ($ref)"""
         if isinstance(schema, dict) and '$ref' in schema:
             ref_path = schema['$ref']
-            if ref_path.startswith('#/components/schemas/'):
-                schema_name = ref_path.split('/')[-1]
+            if ref_path.startswith(SCHEMA_REF_PREFIX):
+                schema_name = ref_path[len(SCHEMA_REF_PREFIX):]
                 if schema_name in self.schemas:
                     return self._resolve_schema_ref(self.schemas[schema_name])
                 else:
@@ -4,17 +4,31 @@ Central pytest configuration and fixtures for the test framework.
 Contains global, session, and module-scope fixtures, and hooks for test data loading.
 """
 import pytest
+import asyncio
 import httpx
 from faker import Faker
 import sys
 import os
 import respx
+import threading
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optioneel (o.a. niet beschikbaar op Windows)
+    uvloop = None
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.config import TestConfig
+from src.async_client import AsyncAPIClient
 from src.test_data_factory import UserFactory, PostFactory, CommentFactory
+from tests.helper_functions import TEST_DATA_PATH, load_test_data, wait_for_port
+
+FAKER_SEED = 12345
+MOCK_API_URL = "https://api.example.com"
+PROVIDER_HOST = "127.0.0.1"
+PROVIDER_PORT = 3000
 
 pytest_plugins = [
     "tests.pytest_metrics_collector",
@@ -23,8 +37,10 @@ pytest_plugins = [
 
 @pytest.fixture(scope="session")
 def fake():
-    """Faker instance for test data generation"""
-    return Faker()
+    """Seeded Faker instance for reproducible test data generation"""
+    faker = Faker()
+    faker.seed_instance(FAKER_SEED)
+    return faker
 
 @pytest.fixture(scope="session") 
 def base_url():
@@ -36,20 +52,79 @@ def test_config():
     """Global test configuration"""
     return TestConfig.from_env()
 
+@pytest.fixture(scope="session")
+def test_data():
+    """Test data from tests/data/test_data.json, loaded once per session"""
+    return load_test_data(TEST_DATA_PATH.resolve())
+
+@pytest.fixture(scope="session")
+def test_cases(test_data):
+    """Test cases section of the shared test data"""
+    return test_data["test_cases"]
+
 import pytest_asyncio
 
-@pytest_asyncio.fixture
+@pytest.fixture(scope="session")
+def event_loop():
+    """Session-wide event loop (uvloop when available) so session-scoped async fixtures can be shared"""
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+@pytest_asyncio.fixture(scope="session")
 async def http_client(base_url):
-    """Async HTTP client for API calls"""
-    async with httpx.AsyncClient(base_url=base_url, timeout=10.0) as client:
+    """Async HTTP client for API calls, shared across the session (HTTP/2 + keepalive)"""
+    limits = httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=60)
+    async with httpx.AsyncClient(base_url=base_url, timeout=10.0, http2=True, limits=limits) as client:
         yield client
 
-@pytest_asyncio.fixture
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """Delegating transport whose close is a no-op, so per-test clients can be closed
+    without closing the shared connection pool (httpx closes a client's transport)"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+@pytest_asyncio.fixture(scope="session")
+async def shared_transport():
+    """HTTP/2 transport shared by per-test clients, so connections are reused across tests"""
+    transport = httpx.AsyncHTTPTransport(http2=True, retries=0, limits=httpx.Limits(max_keepalive_connections=20))
+    yield _SharedTransport(transport)
+    await transport.aclose()
+
+@pytest_asyncio.fixture(scope="session")
+async def client():
+    """AsyncAPIClient shared across the session (routes are mocked per test with respx)"""
+    async with AsyncAPIClient(base_url=MOCK_API_URL, timeout=5) as api_client:
+        yield api_client
+
+@pytest_asyncio.fixture(scope="session")
 async def global_http_client(base_url):
-    """Global async HTTP client for enterprise tests"""
-    async with httpx.AsyncClient(base_url=base_url, timeout=10.0) as client:
+    """Global async HTTP client for enterprise tests, shared across the session (no proxy/env lookups)"""
+    limits = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60)
+    async with httpx.AsyncClient(base_url=base_url, timeout=10.0, trust_env=False, limits=limits) as client:
         yield client
 
+@pytest.fixture(scope="session")
+def provider_server():
+    """Provider service (uvicorn) running in a background thread, started once per session"""
+    import uvicorn
+    from provider.service import app
+
+    server = uvicorn.Server(uvicorn.Config(app, host=PROVIDER_HOST, port=PROVIDER_PORT, log_level="error"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    wait_for_port(PROVIDER_HOST, PROVIDER_PORT)
+    yield f"http://{PROVIDER_HOST}:{PROVIDER_PORT}"
+    server.should_exit = True
+    thread.join(timeout=5)
+
 @pytest.fixture
 def sample_user_data(fake):
     """Generate sample user data for testing"""
@@ -125,6 +200,19 @@ def cleanup_tracker():
             created_resources[resource_type].append(resource_id)
             print(f"Added {resource_type} {resource_id} to cleanup tracker")
     
+    def add_resources(resource_type: str, resource_ids):
+        """Add a batch of resources with a single duplicate check against the tracked list"""
+        resources = created_resources.setdefault(resource_type, [])
+        seen = set(resources)
+        new_ids = []
+        for resource_id in resource_ids:
+            if resource_id not in seen:
+                seen.add(resource_id)
+                new_ids.append(resource_id)
+        resources.extend(new_ids)
+        if new_ids:
+            print(f"Added {len(new_ids)} {resource_type} to cleanup tracker")
+    
     def get_resource_count(resource_type: str) -> int:
         """Get count of tracked resources by type"""
         return len(created_resources.get(resource_type, []))
@@ -136,6 +224,7 @@ def cleanup_tracker():
     
     # Add helper methods to the tracker
     created_resources["add"] = add_resource
+    created_resources["add_many"] = add_resources
     created_resources["count"] = get_resource_count
     created_resources["total"] = get_total_resources
     
@@ -0,0 +1,188 @@
+# conftest.py - Collection-time parametrization for data-driven tests
+"""
+Loads test_data.json once at collection time and parametrizes the data-driven
+tests with the individual cases, so every case becomes its own test item.
+"""
+from typing import Any, Dict, List
+
+import orjson
+import pytest
+
+from tests.helper_functions import TEST_DATA_PATH, load_test_data
+
+VALIDATION_TAGS = ("email", "name", "age", "phone", "postal_code")
+ENDPOINT_CATEGORIES = (
+    ("country=nl", "country_nl"),
+    ("language=nl", "language_nl"),
+    ("status", "status"),
+    ("posts", "posts"),
+)
+# (field getter, substring) pairs that mark a user as Dutch
+DUTCH_CONTACT_MARKERS = (
+    (lambda user: user["email"], ".nl"),
+    (lambda user: user["name"], "de Vries"),
+)
+DUTCH_MARKERS = DUTCH_CONTACT_MARKERS + ((lambda user: user["company"]["name"], "Nederlandse"),)
+# Argnames parametrized from test_data.json, keyed by the fixture name that triggers them
+DATA_ARGNAMES = {
+    "edge_case": "edge_case",
+    "locale_case": "locale_case",
+    "security_case": "security_case",
+    "business_case": "business_case",
+    "dutch_validation_case": "dutch_validation_case",
+    "api_case": "api_case",
+    "perf_case": "perf_case",
+    "validation_tag": "validation_tag,input_value,expected_valid",
+    "error_case": "error_case",
+    "format_case": "format_case",
+    "compression_case": "compression_case",
+    "env_item": "env_item",
+    "role_item": "role_item",
+}
+
+
+def _is_dutch(user: Dict[str, Any], markers) -> bool:
+    """True if any (field getter, substring) marker matches the user"""
+    return any(substring in field(user) for field, substring in markers)
+
+
+@pytest.fixture(scope="session")
+def dutch_users(test_data) -> List[Dict[str, Any]]:
+    """Dutch users (by email, name or company) from the test data, filtered once per session"""
+    return [user for user in test_data["users"] if _is_dutch(user, DUTCH_MARKERS)]
+
+
+@pytest.fixture(scope="session")
+def dutch_users_by_contact(test_data) -> List[Dict[str, Any]]:
+    """Dutch users by email or name only (not company), filtered once per session"""
+    return [user for user in test_data["users"] if _is_dutch(user, DUTCH_CONTACT_MARKERS)]
+
+
+@pytest.fixture(scope="session")
+def indexed_endpoints(test_cases) -> Dict[str, List[Dict[str, Any]]]:
+    """Dutch-specific API endpoints bucketed by category (first match wins)"""
+    buckets: Dict[str, List[Dict[str, Any]]] = {}
+    for case in test_cases["api_endpoints"]:
+        endpoint = case["endpoint"]
+        if "nl" not in endpoint and "language" not in endpoint:
+            continue
+        for marker, category in ENDPOINT_CATEGORIES:
+            if marker in endpoint:
+                buckets.setdefault(category, []).append(case)
+                break
+    return buckets
+
+
+@pytest.fixture(scope="session")
+def users_by_id(test_data) -> Dict[int, Dict[str, Any]]:
+    """Users indexed by id"""
+    return {user["id"]: user for user in test_data["users"]}
+
+
+@pytest.fixture(scope="session")
+def posts_by_id(test_data) -> Dict[int, Dict[str, Any]]:
+    """Posts indexed by id"""
+    return {post["id"]: post for post in test_data["posts"]}
+
+
+@pytest.fixture(scope="session")
+def user_ids_set(users_by_id) -> frozenset:
+    """All user ids in the test data"""
+    return frozenset(users_by_id)
+
+
+@pytest.fixture(scope="session")
+def post_ids_set(posts_by_id) -> frozenset:
+    """All post ids in the test data"""
+    return frozenset(posts_by_id)
+
+
+def _load() -> Dict[str, Any]:
+    """Shared, cached test data (same parse as the session test_data fixture)"""
+    return load_test_data(TEST_DATA_PATH.resolve())
+
+
+def _with_lengths(case: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of an edge case with its input length and stripped length precomputed"""
+    value = case["input"]
+    is_str = isinstance(value, str)
+    return {
+        **case,
+        "_input_len": len(value) if is_str else None,
+        "_stripped_len": len(value.strip()) if is_str else None,
+    }
+
+
+def _validation_tag(scenario: str) -> str:
+    """Map a validation scenario to its validator tag (first match wins)"""
+    for tag in VALIDATION_TAGS:
+        if tag in scenario:
+            if tag == "phone" and "invalid" in scenario:
+                return "phone_invalid"
+            return tag
+    return "other"
+
+
+def _skip_unavailable(metafunc, reason: str) -> None:
+    """Parametrize with a single skipped case when the test data cannot be loaded"""
+    for fixturename, argnames in DATA_ARGNAMES.items():
+        if fixturename in metafunc.fixturenames:
+            values = [None] * len(argnames.split(","))
+            metafunc.parametrize(argnames, [pytest.param(*values, marks=pytest.mark.skip(reason=reason))])
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize data-driven tests with the cases from test_data.json"""
+    fixturenames = metafunc.fixturenames
+    if not any(name in fixturenames for name in DATA_ARGNAMES):
+        return
+    try:
+        _load()
+    except (OSError, orjson.JSONDecodeError) as exc:
+        _skip_unavailable(metafunc, f"test data unavailable: {exc}")
+        return
+
+    if "edge_case" in fixturenames:
+        cases = [_with_lengths(c) for c in _load()["test_cases"]["edge_cases"]]
+        metafunc.parametrize("edge_case", cases, ids=[c["scenario"] for c in cases])
+    if "locale_case" in fixturenames:
+        cases = _load()["test_cases"]["localization_tests"]
+        metafunc.parametrize("locale_case", cases, ids=[c["locale"] for c in cases])
+    if "security_case" in fixturenames:
+        cases = [{**c, "_scenario_lower": c["scenario"].lower()} for c in _load()["test_cases"]["security_tests"]]
+        metafunc.parametrize("security_case", cases, ids=[c["scenario"] for c in cases])
+    if "business_case" in fixturenames:
+        cases = _load()["test_cases"]["business_logic_tests"]
+        metafunc.parametrize("business_case", cases, ids=[c["scenario"] for c in cases])
+    if "dutch_validation_case" in fixturenames:
+        cases = [c for c in _load()["test_cases"]["validation_scenarios"] if "dutch" in c["scenario"].lower()]
+        metafunc.parametrize("dutch_validation_case", cases, ids=[c["scenario"] for c in cases])
+    if "api_case" in fixturenames:
+        cases = _load()["test_cases"]["api_endpoints"]
+        metafunc.parametrize("api_case", cases,
+                             ids=[f"{c['method']} {c['endpoint']}" for c in cases])
+    if "perf_case" in fixturenames:
+        cases = _load()["test_cases"]["performance_tests"]
+        metafunc.parametrize("perf_case", cases, ids=[c["name"] for c in cases])
+    if "validation_tag" in fixturenames:
+        cases = _load()["test_cases"]["validation_scenarios"]
+        metafunc.parametrize(
+            "validation_tag,input_value,expected_valid",
+            [(_validation_tag(c["scenario"]), c["input"], c["expected_valid"]) for c in cases],
+            ids=[c["scenario"] for c in cases],
+        )
+    if "error_case" in fixturenames:
+        cases = _load()["test_cases"]["error_scenarios"]
+        metafunc.parametrize("error_case", cases, ids=[c["error_type"] for c in cases])
+    if "format_case" in fixturenames:
+        formats = _load()["test_cases"]["data_formats"]
+        metafunc.parametrize("format_case", list(formats.items()), ids=list(formats))
+    if "compression_case" in fixturenames:
+        compressions = _load()["test_cases"]["compression_types"]
+        metafunc.parametrize("compression_case", list(compressions.items()), ids=list(compressions))
+    if "env_item" in fixturenames:
+        configs = _load()["test_cases"]["environment_configs"]
+        metafunc.parametrize("env_item", list(configs.items()), ids=list(configs))
+    if "role_item" in fixturenames:
+        matrix = _load()["test_cases"]["permission_matrix"]
+        metafunc.parametrize("role_item", list(matrix.items()), ids=list(matrix))
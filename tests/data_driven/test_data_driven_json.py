@@ -8,17 +8,71 @@ import os
 from typing import Dict, List, Any
 from pathlib import Path
 import re
+from collections import Counter
+
+_POSTAL_CODE_RE = re.compile(r"^[0-9]{4} [A-Z]{2}$")
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def _is_email(value: Any) -> bool:
+    return bool(_EMAIL_RE.match(str(value)))
+
+
+def _is_age(value: Any) -> bool:
+    if isinstance(value, int):
+        return 0 <= value <= 150
+    try:
+        age = int(value)
+    except (ValueError, TypeError):
+        return False
+    return 0 <= age <= 150
+
+
+def _is_phone(value: Any) -> bool:
+    s = value if isinstance(value, str) else str(value)
+    return s.startswith("+31-6-") and len(s) >= 13
+
+
+def _is_invalid_phone(value: Any) -> bool:
+    s = value if isinstance(value, str) else str(value)
+    return len(s) < 13
+
+
+def _is_postal(value: Any) -> bool:
+    return bool(_POSTAL_CODE_RE.match(str(value)))
+
+
+# Validator per scenario-tag; de tag wordt in conftest.py bij collectie bepaald
+_VALIDATORS = {
+    "email": _is_email,
+    "name": lambda v: len(str(v).strip()) > 0,
+    "age": _is_age,
+    "phone": _is_phone,
+    "phone_invalid": _is_invalid_phone,
+    "postal_code": _is_postal,
+    "other": lambda v: True,
+}
+
+_ALLOWED_ERROR_TYPES = frozenset({
+    "timeout", "network", "validation", "server_error", "not_found",
+    "rate_limit", "authentication", "authorization", "database_connection", "service_unavailable",
+})
+_ALLOWED_ROLES = frozenset({"admin", "user", "guest", "moderator", "editor"})
+_ALLOWED_RESOURCES = frozenset({"users", "posts", "comments", "albums", "todos"})
+_ALLOWED_ACTIONS = frozenset({"read", "write", "delete"})
+_ALLOWED_ENVS = frozenset({"development", "staging", "production", "testing", "local"})
+_ALLOWED_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR"})
+_ALLOWED_FORMATS = frozenset({"json", "xml", "csv", "yaml", "pdf", "excel"})
+_ALLOWED_COMPRESSIONS = frozenset({"none", "gzip", "zip", "brotli", "lz4", "zstd"})
+
+
+def _duplicate_ids(records: List[Dict[str, Any]]) -> List[Any]:
+    """IDs die meer dan eens voorkomen in een collectie"""
+    return [record_id for record_id, count in Counter(r["id"] for r in records).items() if count > 1]
 
 class TestDataDrivenJSON:
     """Data-driven tests using external JSON data file"""
     
-    @pytest.fixture(scope="class")
-    def test_data(self) -> Dict[str, Any]:
-        """Load test data from JSON file"""
-        json_path = Path(__file__).parent.parent / "data" / "test_data.json"
-        with open(json_path, 'r') as f:
-            return json.load(f)
-    
     @pytest.fixture
     def users_data(self, test_data) -> List[Dict[str, Any]]:
         """Extract users data from test data"""
@@ -34,10 +88,6 @@ class TestDataDrivenJSON:
         """Extract comments data from test data"""
         return test_data["comments"]
     
-    @pytest.fixture
-    def test_cases(self, test_data) -> Dict[str, Any]:
-        """Extract test cases from test data"""
-        return test_data["test_cases"]
     
     # 1. Test user data structure and validation
     def test_user_data_structure(self, users_data):
@@ -116,302 +166,214 @@ class TestDataDrivenJSON:
             assert is_valid == (test_case == "valid_users"), f"User validation failed: {case}"
     
     # 5. API endpoint testing with data
-    @pytest.mark.parametrize("endpoint_case", [
-        pytest.param("api_endpoints", id="api_endpoint_cases")
-    ])
-    def test_api_endpoint_scenarios(self, test_cases, endpoint_case):
+    def test_api_endpoint_scenarios(self, api_case):
         """Test API endpoint scenarios using data from JSON"""
-        cases = test_cases[endpoint_case]
+        # Simulate API call validation
+        method = api_case["method"]
+        endpoint = api_case["endpoint"]
+        expected_status = api_case["expected_status"]
         
-        for case in cases:
-            # Simulate API call validation
-            method = case["method"]
-            endpoint = case["endpoint"]
-            expected_status = case["expected_status"]
-            
-            # Basic validation
-            assert method in ["GET", "POST", "PUT", "DELETE", "PATCH"]
-            assert endpoint.startswith("/")
-            assert expected_status in [200, 201, 204, 400, 401, 403, 404, 500]
-            
-            # Method-specific validations
-            if method == "GET":
-                assert expected_status in [200, 404]
-            elif method == "POST":
-                assert expected_status in [201, 400, 422]
-            elif method in ["PUT", "DELETE"]:
-                assert expected_status in [200, 404]
+        # Basic validation
+        assert method in ["GET", "POST", "PUT", "DELETE", "PATCH"]
+        assert endpoint.startswith("/")
+        assert expected_status in [200, 201, 204, 400, 401, 403, 404, 500]
+        
+        # Method-specific validations
+        if method == "GET":
+            assert expected_status in [200, 404]
+        elif method == "POST":
+            assert expected_status in [201, 400, 422]
+        elif method in ["PUT", "DELETE"]:
+            assert expected_status in [200, 404]
     
     # 6. Performance test scenarios
-    @pytest.mark.parametrize("perf_case", [
-        pytest.param("performance_tests", id="performance_test_cases")
-    ])
-    def test_performance_scenarios(self, test_cases, perf_case):
+    def test_performance_scenarios(self, perf_case):
         """Test performance scenarios using data from JSON"""
-        cases = test_cases[perf_case]
+        # Validate performance test parameters
+        assert perf_case["concurrent_users"] > 0
+        assert perf_case["requests_per_user"] > 0
+        assert perf_case["expected_avg_response_time"] > 0
         
-        for case in cases:
-            # Validate performance test parameters
-            assert case["concurrent_users"] > 0
-            assert case["requests_per_user"] > 0
-            assert case["expected_avg_response_time"] > 0
-            
-            # Simulate performance calculation
-            total_requests = case["concurrent_users"] * case["requests_per_user"]
-            assert total_requests > 0
-            
-            # Validate response time expectations (ruimer voor stress/peak tests)
-            if case["name"].lower().startswith("low"):
-                assert case["expected_avg_response_time"] <= 0.2
-            elif case["name"].lower().startswith("medium"):
-                assert case["expected_avg_response_time"] <= 0.5
-            elif case["name"].lower().startswith("high"):
-                assert case["expected_avg_response_time"] <= 1.0
-            else:
-                # Sta hogere tijden toe voor stress/peak/dutch market
-                assert case["expected_avg_response_time"] <= 2.0
+        # Simulate performance calculation
+        total_requests = perf_case["concurrent_users"] * perf_case["requests_per_user"]
+        assert total_requests > 0
+        
+        # Validate response time expectations (ruimer voor stress/peak tests)
+        if perf_case["name"].lower().startswith("low"):
+            assert perf_case["expected_avg_response_time"] <= 0.2
+        elif perf_case["name"].lower().startswith("medium"):
+            assert perf_case["expected_avg_response_time"] <= 0.5
+        elif perf_case["name"].lower().startswith("high"):
+            assert perf_case["expected_avg_response_time"] <= 1.0
+        else:
+            # Sta hogere tijden toe voor stress/peak/dutch market
+            assert perf_case["expected_avg_response_time"] <= 2.0
     
     # 7. Validation scenario testing
-    @pytest.mark.parametrize("validation_case", [
-        pytest.param("validation_scenarios", id="validation_scenario_cases")
-    ])
-    def test_validation_scenarios(self, test_cases, validation_case):
+    def test_validation_scenarios(self, validation_tag, input_value, expected_valid):
         """Test validation scenarios using data from JSON"""
-        cases = test_cases[validation_case]
-        postal_code_regex = re.compile(r"^[0-9]{4} [A-Z]{2}$")
-        email_regex = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
-        
-        for case in cases:
-            scenario = case["scenario"]
-            input_value = case["input"]
-            expected_valid = case["expected_valid"]
-            
-            # Simuleer validatie logica
-            is_valid = True
-            
-            if "email" in scenario:
-                is_valid = bool(email_regex.match(str(input_value)))
-            elif "name" in scenario:
-                is_valid = len(str(input_value).strip()) > 0
-            elif "age" in scenario:
-                try:
-                    age = int(input_value)
-                    is_valid = 0 <= age <= 150
-                except (ValueError, TypeError):
-                    is_valid = False
-            elif "phone" in scenario:
-                if "invalid" in scenario:
-                    is_valid = len(str(input_value)) < 13
-                else:
-                    is_valid = str(input_value).startswith("+31-6-") and len(str(input_value)) >= 13
-            elif "postal_code" in scenario:
-                is_valid = bool(postal_code_regex.match(str(input_value)))
-            
-            if is_valid != expected_valid:
-                print(f"DEBUG: scenario={scenario}, input={input_value}, expected_valid={expected_valid}, is_valid={is_valid}")
-            assert is_valid == expected_valid, f"Validation failed for scenario: {scenario} (input: {input_value}, expected: {expected_valid}, got: {is_valid})"
+        is_valid = _VALIDATORS[validation_tag](input_value)
+        assert is_valid == expected_valid, f"Validation failed for {validation_tag} (input: {input_value}, expected: {expected_valid}, got: {is_valid})"
     
     # 8. Error scenario testing
-    @pytest.mark.parametrize("error_case", [
-        pytest.param("error_scenarios", id="error_scenario_cases")
-    ])
-    def test_error_scenarios(self, test_cases, error_case):
+    def test_error_scenarios(self, error_case):
         """Test error scenarios using data from JSON"""
-        cases = test_cases[error_case]
+        error_type = error_case["error_type"]
+        expected_behavior = error_case["expected_behavior"]
+        max_retries = error_case["max_retries"]
         
-        allowed_types = [
-            "timeout", "network", "validation", "server_error", "not_found",
-            "rate_limit", "authentication", "authorization", "database_connection", "service_unavailable"
-        ]
-        for case in cases:
-            error_type = case["error_type"]
-            expected_behavior = case["expected_behavior"]
-            max_retries = case["max_retries"]
-            
-            # Validate error handling configuration
-            assert error_type in allowed_types
-            
-            # Validate retry logic
-            if expected_behavior == "fail_fast":
-                assert max_retries == 0
-            else:
-                assert max_retries > 0
+        # Validate error handling configuration
+        assert error_type in _ALLOWED_ERROR_TYPES
+        
+        # Validate retry logic
+        if expected_behavior == "fail_fast":
+            assert max_retries == 0
+        else:
+            assert max_retries > 0
     
     # 9. Permission matrix testing
-    @pytest.mark.parametrize("permission_case", [
-        pytest.param("permission_matrix", id="permission_matrix_cases")
-    ])
-    def test_permission_matrix(self, test_cases, permission_case):
+    def test_permission_matrix(self, role_item):
         """Test permission matrix using data from JSON"""
-        matrix = test_cases[permission_case]
+        role, permissions = role_item
+        
+        assert role in _ALLOWED_ROLES
         
-        allowed_roles = ["admin", "user", "guest", "moderator", "editor"]
-        for role, permissions in matrix.items():
-            assert role in allowed_roles
+        for resource, actions in permissions.items():
+            assert resource in _ALLOWED_RESOURCES
+            assert isinstance(actions, list)
+            
+            for action in actions:
+                assert action in _ALLOWED_ACTIONS
             
-            for resource, actions in permissions.items():
-                assert resource in ["users", "posts", "comments", "albums", "todos"]
-                assert isinstance(actions, list)
-                
-                for action in actions:
-                    assert action in ["read", "write", "delete"]
-                
-                # Validate role-specific permissions
-                if role == "admin":
-                    assert "read" in actions
+            # Validate role-specific permissions
+            if role == "admin":
+                assert "read" in actions
+                assert "write" in actions
+                assert "delete" in actions
+            elif role == "user":
+                assert "read" in actions
+                if resource == "users":
+                    assert "write" not in actions
+                    assert "delete" not in actions
+                else:
+                    assert "write" in actions
+                    assert "delete" not in actions
+            elif role == "guest":
+                assert "read" in actions
+                assert "write" not in actions
+                assert "delete" not in actions
+            elif role == "moderator":
+                assert "read" in actions
+                if resource in ["posts", "comments"]:
                     assert "write" in actions
                     assert "delete" in actions
-                elif role == "user":
-                    assert "read" in actions
-                    if resource == "users":
-                        assert "write" not in actions
-                        assert "delete" not in actions
-                    else:
-                        assert "write" in actions
-                        assert "delete" not in actions
-                elif role == "guest":
-                    assert "read" in actions
+                else:
                     assert "write" not in actions
                     assert "delete" not in actions
-                elif role == "moderator":
-                    assert "read" in actions
-                    if resource in ["posts", "comments"]:
-                        assert "write" in actions
-                        assert "delete" in actions
-                    else:
-                        assert "write" not in actions
-                        assert "delete" not in actions
-                elif role == "editor":
-                    assert "read" in actions
-                    # Editor has write permissions on all resources except users
-                    if resource != "users":
-                        assert "write" in actions
-                    assert "delete" not in actions
+            elif role == "editor":
+                assert "read" in actions
+                # Editor has write permissions on all resources except users
+                if resource != "users":
+                    assert "write" in actions
+                assert "delete" not in actions
     
     # 10. Environment configuration testing
-    @pytest.mark.parametrize("env_case", [
-        pytest.param("environment_configs", id="environment_config_cases")
-    ])
-    def test_environment_configs(self, test_cases, env_case):
+    def test_environment_configs(self, env_item):
         """Test environment configurations using data from JSON"""
-        configs = test_cases[env_case]
+        env, config = env_item
         
-        allowed_envs = ["development", "staging", "production", "testing", "local"]
-        for env, config in configs.items():
-            assert env in allowed_envs
-            
-            # Validate configuration parameters
-            assert config["timeout"] > 0
-            assert config["retries"] >= 0
-            assert isinstance(config["debug"], bool)
-            assert config["log_level"] in ["DEBUG", "INFO", "WARNING", "ERROR"]
-            assert isinstance(config["cache_enabled"], bool)
-            
-            # Environment-specific validations
-            if env == "development":
-                assert config["debug"] == True
-                assert config["timeout"] <= 15
-            elif env == "staging":
-                assert config["debug"] == False
-                assert 10 <= config["timeout"] <= 20
-            elif env == "production":
-                assert config["debug"] == False
-                assert config["timeout"] >= 15
-            elif env == "testing":
-                assert config["debug"] == True
-                assert config["timeout"] <= 10
-            elif env == "local":
-                assert config["debug"] == True
-                assert config["timeout"] >= 10
+        assert env in _ALLOWED_ENVS
+        
+        # Validate configuration parameters
+        assert config["timeout"] > 0
+        assert config["retries"] >= 0
+        assert isinstance(config["debug"], bool)
+        assert config["log_level"] in _ALLOWED_LOG_LEVELS
+        assert isinstance(config["cache_enabled"], bool)
+        
+        # Environment-specific validations
+        if env == "development":
+            assert config["debug"] == True
+            assert config["timeout"] <= 15
+        elif env == "staging":
+            assert config["debug"] == False
+            assert 10 <= config["timeout"] <= 20
+        elif env == "production":
+            assert config["debug"] == False
+            assert config["timeout"] >= 15
+        elif env == "testing":
+            assert config["debug"] == True
+            assert config["timeout"] <= 10
+        elif env == "local":
+            assert config["debug"] == True
+            assert config["timeout"] >= 10
     
     # 11. Data format testing
-    @pytest.mark.parametrize("format_case", [
-        pytest.param("data_formats", id="data_format_cases")
-    ])
-    def test_data_formats(self, test_cases, format_case):
+    def test_data_formats(self, format_case):
         """Test data formats using data from JSON"""
-        formats = test_cases[format_case]
+        format_name, format_info = format_case
         
-        allowed_formats = ["json", "xml", "csv", "yaml", "pdf", "excel"]
-        for format_name, format_info in formats.items():
-            assert format_name in allowed_formats
-            
-            # Validate format information
-            assert "mime_type" in format_info
-            assert "extension" in format_info
-            assert "description" in format_info
-            
-            # Validate MIME types
-            if format_name == "json":
-                assert format_info["mime_type"] == "application/json"
-            elif format_name == "xml":
-                assert format_info["mime_type"] == "application/xml"
-            elif format_name == "csv":
-                assert format_info["mime_type"] == "text/csv"
-            elif format_name == "yaml":
-                assert format_info["mime_type"] == "application/x-yaml"
+        assert format_name in _ALLOWED_FORMATS
+        
+        # Validate format information
+        assert "mime_type" in format_info
+        assert "extension" in format_info
+        assert "description" in format_info
+        
+        # Validate MIME types
+        if format_name == "json":
+            assert format_info["mime_type"] == "application/json"
+        elif format_name == "xml":
+            assert format_info["mime_type"] == "application/xml"
+        elif format_name == "csv":
+            assert format_info["mime_type"] == "text/csv"
+        elif format_name == "yaml":
+            assert format_info["mime_type"] == "application/x-yaml"
     
     # 12. Compression type testing
-    @pytest.mark.parametrize("compression_case", [
-        pytest.param("compression_types", id="compression_type_cases")
-    ])
-    def test_compression_types(self, test_cases, compression_case):
+    def test_compression_types(self, compression_case):
         """Test compression types using data from JSON"""
-        compressions = test_cases[compression_case]
+        comp_name, comp_info = compression_case
         
-        allowed_compressions = ["none", "gzip", "zip", "brotli", "lz4", "zstd"]
-        for comp_name, comp_info in compressions.items():
-            assert comp_name in allowed_compressions
-            
-            # Validate compression information
-            assert "algorithm" in comp_info
-            assert "compression_ratio" in comp_info
-            assert "description" in comp_info
-            
-            # Validate compression ratios
-            assert 0 < comp_info["compression_ratio"] <= 1
-            
-            if comp_name == "none":
-                assert comp_info["compression_ratio"] == 1.0
-            else:
-                assert comp_info["compression_ratio"] < 1.0
+        assert comp_name in _ALLOWED_COMPRESSIONS
+        
+        # Validate compression information
+        assert "algorithm" in comp_info
+        assert "compression_ratio" in comp_info
+        assert "description" in comp_info
+        
+        # Validate compression ratios
+        assert 0 < comp_info["compression_ratio"] <= 1
+        
+        if comp_name == "none":
+            assert comp_info["compression_ratio"] == 1.0
+        else:
+            assert comp_info["compression_ratio"] < 1.0
     
     # 13. Metadata validation
     def test_metadata(self, test_data):
         """Test metadata information"""
         metadata = test_data["metadata"]
         
-        assert "created" in metadata
-        assert "version" in metadata
-        assert "description" in metadata
-        assert "total_records" in metadata
+        assert {"created", "version", "description", "total_records"} <= metadata.keys()
         
         # Validate total records
         total_records = metadata["total_records"]
-        assert total_records["users"] == 5
-        assert total_records["posts"] == 10
-        assert total_records["comments"] == 10
-        assert total_records["albums"] == 10
-        assert total_records["todos"] == 10
+        assert {k: total_records[k] for k in ("users", "posts", "comments", "albums", "todos")} == {
+            "users": 5, "posts": 10, "comments": 10, "albums": 10, "todos": 10
+        }
     
     # 14. Cross-reference data integrity
-    def test_data_integrity(self, users_data, posts_data, comments_data):
+    def test_data_integrity(self, users_data, posts_data, comments_data, user_ids_set, post_ids_set):
         """Test data integrity across different collections"""
-        user_ids = {user["id"] for user in users_data}
-        post_ids = {post["id"] for post in posts_data}
-        comment_ids = {comment["id"] for comment in comments_data}
-        
         # Check for unique IDs within each collection
-        assert len(user_ids) == len(users_data)
-        assert len(post_ids) == len(posts_data)
-        assert len(comment_ids) == len(comments_data)
+        assert _duplicate_ids(users_data) == []
+        assert _duplicate_ids(posts_data) == []
+        assert _duplicate_ids(comments_data) == []
         
         # Check that all referenced IDs exist
-        for post in posts_data:
-            assert post["userId"] in user_ids
-        
-        for comment in comments_data:
-            assert comment["postId"] in post_ids
+        assert {post["userId"] for post in posts_data} <= user_ids_set
+        assert {comment["postId"] for comment in comments_data} <= post_ids_set
     
     # 15. Data-driven test with custom IDs
     @pytest.mark.parametrize("user", [
@@ -419,14 +381,13 @@ class TestDataDrivenJSON:
         pytest.param(2, id="user_2"),
         pytest.param(3, id="user_3")
     ])
-    def test_user_specific_data(self, users_data, user):
+    def test_user_specific_data(self, users_by_id, user):
         """Test specific user data with custom IDs"""
-        user_data = next((u for u in users_data if u["id"] == user), None)
+        user_data = users_by_id.get(user)
         assert user_data is not None
         
         # Validate user data
         assert user_data["id"] == user
         assert len(user_data["name"]) > 0
         assert "@" in user_data["email"]
-        assert len(user_data["username"]) > 0 
         assert len(user_data["username"]) > 0 
\ No newline at end of file
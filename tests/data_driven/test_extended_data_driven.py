@@ -8,26 +8,38 @@ import re
 from typing import Dict, List, Any
 from pathlib import Path
 
+_SQL_PATTERNS = ("'", ";", "DROP", "TABLE", "SELECT", "--")
+_XSS_PATTERNS = ("<script>", "</script>", "javascript:", "onload=")
+_SQL_RE = re.compile("|".join(map(re.escape, _SQL_PATTERNS)), re.IGNORECASE)
+_XSS_RE = re.compile("|".join(map(re.escape, _XSS_PATTERNS)), re.IGNORECASE)
+_SPECIAL_CHARS_RE = re.compile(r'^[a-zA-Z0-9\-_]+\Z')
+
+_REQUIRED_FEATURES = frozenset({
+    "Dutch localization test cases", "Edge case scenarios", "Security test cases", "Business logic test cases",
+})
+
+# Verwachte (method, status) per categorie Nederlandse endpoints
+_ENDPOINT_EXPECTATIONS = {
+    "country_nl": ("GET", 200),
+    "language_nl": ("GET", 200),
+    "status": ("PATCH", 200),
+    "posts": ("GET", 200),
+}
+
+# Verplichte acties per business logic scenario
+_REQUIRED_ACTIONS = {
+    "user_registration": frozenset({"validate_input", "check_duplicate", "create_user", "send_welcome_email"}),
+    "post_creation": frozenset({"validate_input", "check_user_exists", "create_post"}),
+    "comment_moderation": frozenset({"check_spam", "moderate_content", "approve_or_reject"}),
+    "user_deletion": frozenset({"backup_data", "delete_user", "delete_related_data"}),
+}
+
 class TestExtendedDataDriven:
     """Extended data-driven tests using enhanced JSON data file"""
     
-    @pytest.fixture(scope="class")
-    def test_data(self) -> Dict[str, Any]:
-        """Load enhanced test data from JSON file"""
-        json_path = Path(__file__).parent.parent / "data" / "test_data.json"
-        with open(json_path, 'r') as f:
-            return json.load(f)
-    
-    @pytest.fixture
-    def test_cases(self, test_data) -> Dict[str, Any]:
-        """Extract test cases from test data"""
-        return test_data["test_cases"]
-    
     # 1. Test Dutch users and validation
-    def test_dutch_users_validation(self, test_data):
+    def test_dutch_users_validation(self, dutch_users):
         """Test Dutch users and their validation"""
-        dutch_users = [user for user in test_data["users"] if ".nl" in user["email"] or "Nederlandse" in user["company"]["name"] or "de Vries" in user["name"]]
-        
         assert len(dutch_users) >= 2, "There must be at least 2 Dutch users"
         
         for user in dutch_users:
@@ -47,201 +59,150 @@ class TestExtendedDataDriven:
                 assert " " in zipcode  # Space between numbers and letters
     
     # 2. Test edge cases
-    @pytest.mark.parametrize("edge_case", [
-        pytest.param("edge_cases", id="edge_case_scenarios")
-    ])
-    def test_edge_cases(self, test_cases, edge_case):
+    def test_edge_cases(self, edge_case):
         """Test edge cases using data from JSON"""
-        cases = test_cases[edge_case]
+        scenario = edge_case["scenario"]
+        input_value = edge_case["input"]
+        expected_valid = edge_case["expected_valid"]
         
-        for case in cases:
-            scenario = case["scenario"]
-            input_value = case["input"]
-            expected_valid = case["expected_valid"]
-            
-            # Simulate edge case validation
-            is_valid = True
-            
-            if scenario == "unicode_names":
-                # Unicode names should be valid
-                is_valid = isinstance(input_value, str) and len(input_value) > 0
-            elif scenario == "very_long_name":
-                # Very long names should be invalid
-                is_valid = len(input_value) <= 100
-            elif scenario == "special_characters":
-                # Special characters in usernames should be valid
-                is_valid = re.match(r'^[a-zA-Z0-9\-_]+$', input_value) is not None
-            elif scenario == "empty_string":
-                # Empty strings should be invalid
-                is_valid = len(input_value.strip()) > 0
-            elif scenario == "null_value":
-                # Null values should be invalid
-                is_valid = input_value is not None
-            elif scenario == "whitespace_only":
-                # Whitespace only should be invalid
-                is_valid = len(input_value.strip()) > 0
-            elif scenario == "sql_injection":
-                # SQL injection attempts should be invalid
-                sql_patterns = ["'", ";", "DROP", "TABLE", "SELECT", "--"]
-                is_valid = not any(pattern in input_value.upper() for pattern in sql_patterns)
-            elif scenario == "xss_attempt":
-                # XSS attempts should be invalid
-                xss_patterns = ["<script>", "</script>", "javascript:", "onload="]
-                is_valid = not any(pattern in input_value.lower() for pattern in xss_patterns)
-            
-            assert is_valid == expected_valid, f"Edge case failed: {scenario}"
+        # Simulate edge case validation
+        is_valid = True
+        
+        if scenario == "unicode_names":
+            # Unicode names should be valid
+            is_valid = isinstance(input_value, str) and len(input_value) > 0
+        elif scenario == "very_long_name":
+            # Very long names should be invalid
+            is_valid = edge_case["_input_len"] <= 100
+        elif scenario == "special_characters":
+            # Special characters in usernames should be valid
+            is_valid = _SPECIAL_CHARS_RE.match(input_value) is not None
+        elif scenario == "empty_string":
+            # Empty strings should be invalid
+            is_valid = edge_case["_stripped_len"] > 0
+        elif scenario == "null_value":
+            # Null values should be invalid
+            is_valid = input_value is not None
+        elif scenario == "whitespace_only":
+            # Whitespace only should be invalid
+            is_valid = edge_case["_stripped_len"] > 0
+        elif scenario == "sql_injection":
+            # SQL injection attempts should be invalid
+            is_valid = _SQL_RE.search(input_value) is None
+        elif scenario == "xss_attempt":
+            # XSS attempts should be invalid
+            is_valid = _XSS_RE.search(input_value) is None
+        
+        assert is_valid == expected_valid, f"Edge case failed: {scenario}"
     
     # 3. Test localization scenarios
-    @pytest.mark.parametrize("locale_test", [
-        pytest.param("localization_tests", id="localization_scenarios")
-    ])
-    def test_localization_scenarios(self, test_cases, locale_test):
+    def test_localization_scenarios(self, locale_case):
         """Test localization scenarios using data from JSON"""
-        cases = test_cases[locale_test]
+        locale = locale_case["locale"]
+        currency = locale_case["currency"]
+        date_format = locale_case["date_format"]
+        time_format = locale_case["time_format"]
+        decimal_separator = locale_case["decimal_separator"]
+        thousands_separator = locale_case["thousands_separator"]
         
-        for case in cases:
-            locale = case["locale"]
-            currency = case["currency"]
-            date_format = case["date_format"]
-            time_format = case["time_format"]
-            decimal_separator = case["decimal_separator"]
-            thousands_separator = case["thousands_separator"]
-            
-            # Validate locale format
-            assert "_" in locale
-            assert len(locale.split("_")) == 2
-            
-            # Validate currency codes
-            assert len(currency) == 3
-            assert currency.isalpha()
-            
-            # Validate date format
-            assert "YYYY" in date_format
-            assert "DD" in date_format or "MM" in date_format
-            
-            # Validate separators
-            assert decimal_separator in [",", "."]
-            assert thousands_separator in [",", ".", " "]
-            
-            # Locale-specific validations
-            if locale == "nl_NL":
-                assert currency == "EUR"
-                assert date_format == "DD-MM-YYYY"
-                assert decimal_separator == ","
-                assert thousands_separator == "."
-            elif locale == "en_US":
-                assert currency == "USD"
-                assert date_format == "MM/DD/YYYY"
-                assert decimal_separator == "."
-                assert thousands_separator == ","
+        # Validate locale format
+        assert "_" in locale
+        assert len(locale.split("_")) == 2
+        
+        # Validate currency codes
+        assert len(currency) == 3
+        assert currency.isalpha()
+        
+        # Validate date format
+        assert "YYYY" in date_format
+        assert "DD" in date_format or "MM" in date_format
+        
+        # Validate separators
+        assert decimal_separator in [",", "."]
+        assert thousands_separator in [",", ".", " "]
+        
+        # Locale-specific validations
+        if locale == "nl_NL":
+            assert currency == "EUR"
+            assert date_format == "DD-MM-YYYY"
+            assert decimal_separator == ","
+            assert thousands_separator == "."
+        elif locale == "en_US":
+            assert currency == "USD"
+            assert date_format == "MM/DD/YYYY"
+            assert decimal_separator == "."
+            assert thousands_separator == ","
     
     # 4. Test security scenarios
-    @pytest.mark.parametrize("security_test", [
-        pytest.param("security_tests", id="security_scenarios")
-    ])
-    def test_security_scenarios(self, test_cases, security_test):
+    def test_security_scenarios(self, security_case):
         """Test security scenarios using data from JSON"""
-        cases = test_cases[security_test]
+        test_type = security_case["test_type"]
+        scenario = security_case["scenario"]
+        scenario_lower = security_case["_scenario_lower"]
+        expected_result = security_case["expected_result"]
         
-        for case in cases:
-            test_type = case["test_type"]
-            scenario = case["scenario"]
-            expected_result = case["expected_result"]
-            
-            # Simulate security validation
-            if test_type == "authentication":
-                if scenario == "valid_credentials":
-                    result = "success"
-                elif scenario in ["invalid_password", "nonexistent_user"]:
-                    result = "failure"
-                else:
-                    result = "unknown"
-            elif test_type == "authorization":
-                if scenario == "admin_access":
-                    result = "denied"
-                else:
-                    result = "unknown"
-            elif test_type == "input_validation":
-                if "xss" in scenario.lower() or scenario.lower() == "email_injection":
-                    result = "sanitized"
-                elif "sql_injection" in scenario.lower():
-                    result = "rejected"
-                else:
-                    result = "unknown"
+        # Simulate security validation
+        if test_type == "authentication":
+            if scenario == "valid_credentials":
+                result = "success"
+            elif scenario in ["invalid_password", "nonexistent_user"]:
+                result = "failure"
             else:
                 result = "unknown"
-            
-            assert result == expected_result, f"Security test failed: {scenario}"
+        elif test_type == "authorization":
+            if scenario == "admin_access":
+                result = "denied"
+            else:
+                result = "unknown"
+        elif test_type == "input_validation":
+            if "xss" in scenario_lower or scenario_lower == "email_injection":
+                result = "sanitized"
+            elif "sql_injection" in scenario_lower:
+                result = "rejected"
+            else:
+                result = "unknown"
+        else:
+            result = "unknown"
+        
+        assert result == expected_result, f"Security test failed: {scenario}"
     
     # 5. Test business logic scenarios
-    @pytest.mark.parametrize("business_test", [
-        pytest.param("business_logic_tests", id="business_logic_scenarios")
-    ])
-    def test_business_logic_scenarios(self, test_cases, business_test):
+    def test_business_logic_scenarios(self, business_case):
         """Test business logic scenarios using data from JSON"""
-        cases = test_cases[business_test]
+        scenario = business_case["scenario"]
+        input_data = business_case["input"]
+        expected_actions = business_case["expected_actions"]
         
-        for case in cases:
-            scenario = case["scenario"]
-            input_data = case["input"]
-            expected_actions = case["expected_actions"]
+        # Simulate business logic validation
+        if scenario == "user_registration":
+            assert _REQUIRED_ACTIONS[scenario].issubset(expected_actions)
             
-            # Simulate business logic validation
-            if scenario == "user_registration":
-                required_actions = ["validate_input", "check_duplicate", "create_user", "send_welcome_email"]
-                assert all(action in expected_actions for action in required_actions)
-                
-                # Validate input data
-                assert "name" in input_data
-                assert "email" in input_data
-                assert "age" in input_data
-                
-            elif scenario == "post_creation":
-                required_actions = ["validate_input", "check_user_exists", "create_post"]
-                assert all(action in expected_actions for action in required_actions)
-                
-                # Validate input data
-                assert "title" in input_data
-                assert "body" in input_data
-                assert "userId" in input_data
-                
-            elif scenario == "comment_moderation":
-                required_actions = ["check_spam", "moderate_content", "approve_or_reject"]
-                assert all(action in expected_actions for action in required_actions)
-                
-            elif scenario == "user_deletion":
-                required_actions = ["backup_data", "delete_user", "delete_related_data"]
-                assert all(action in expected_actions for action in required_actions)
+            # Validate input data
+            assert "name" in input_data
+            assert "email" in input_data
+            assert "age" in input_data
+            
+        elif scenario == "post_creation":
+            assert _REQUIRED_ACTIONS[scenario].issubset(expected_actions)
+            
+            # Validate input data
+            assert "title" in input_data
+            assert "body" in input_data
+            assert "userId" in input_data
+            
+        elif scenario == "comment_moderation":
+            assert _REQUIRED_ACTIONS[scenario].issubset(expected_actions)
+            
+        elif scenario == "user_deletion":
+            assert _REQUIRED_ACTIONS[scenario].issubset(expected_actions)
     
     # 6. Test extended API endpoints
-    @pytest.mark.parametrize("endpoint_test", [
-        pytest.param("api_endpoints", id="extended_api_endpoints")
-    ])
-    def test_extended_api_endpoints(self, test_cases, endpoint_test):
+    def test_extended_api_endpoints(self, indexed_endpoints):
         """Test extended API endpoints using data from JSON"""
-        cases = test_cases[endpoint_test]
-        
-        # Find Dutch-specific endpoints
-        dutch_endpoints = [case for case in cases if "nl" in case["endpoint"] or "language" in case["endpoint"]]
-        
-        for case in dutch_endpoints:
-            method = case["method"]
-            endpoint = case["endpoint"]
-            expected_status = case["expected_status"]
-            
-            # Validate Dutch-specific endpoints
-            if "country=nl" in endpoint:
-                assert method == "GET"
-                assert expected_status == 200
-            elif "language=nl" in endpoint:
-                assert method == "GET"
-                assert expected_status == 200
-            elif "status" in endpoint:
-                assert method == "PATCH"
-                assert expected_status == 200
-            elif "posts" in endpoint:
-                assert method == "GET"
-                assert expected_status == 200
+        for category, (expected_method, expected_status) in _ENDPOINT_EXPECTATIONS.items():
+            for case in indexed_endpoints.get(category, ()):
+                assert case["method"] == expected_method
+                assert case["expected_status"] == expected_status
     
     # 7. Test enhanced performance scenarios
     @pytest.mark.parametrize("perf_test", [
@@ -272,38 +233,29 @@ class TestExtendedDataDriven:
             assert expected_avg_response_time <= 1.0
     
     # 8. Test extended validation scenarios
-    @pytest.mark.parametrize("validation_test", [
-        pytest.param("validation_scenarios", id="extended_validation_scenarios")
-    ])
-    def test_extended_validation_scenarios(self, test_cases, validation_test):
+    def test_extended_validation_scenarios(self, dutch_validation_case):
         """Test extended validation scenarios including Dutch-specific cases"""
-        cases = test_cases[validation_test]
+        scenario = dutch_validation_case["scenario"]
+        input_value = dutch_validation_case["input"]
+        expected_valid = dutch_validation_case["expected_valid"]
         
-        # Find Dutch-specific validation cases
-        dutch_validation_cases = [case for case in cases if "dutch" in case["scenario"].lower()]
+        # Simulate Dutch-specific validation
+        is_valid = True
         
-        for case in dutch_validation_cases:
-            scenario = case["scenario"]
-            input_value = case["input"]
-            expected_valid = case["expected_valid"]
-            
-            # Simulate Dutch-specific validation
-            is_valid = True
-            
-            if "dutch_email" in scenario:
-                is_valid = "@" in input_value and ".nl" in input_value
-            elif "dutch_phone" in scenario:
-                if "invalid" in scenario:
-                    is_valid = len(input_value) < 13  # Too short
-                else:
-                    is_valid = input_value.startswith("+31-6-") and len(input_value) >= 13
-            elif "postal_code" in scenario:
-                if "invalid" in scenario:
-                    is_valid = " " not in input_value  # Missing space
-                else:
-                    is_valid = " " in input_value and len(input_value) >= 6
-            
-            assert is_valid == expected_valid, f"Dutch validation failed: {scenario}"
+        if "dutch_email" in scenario:
+            is_valid = "@" in input_value and ".nl" in input_value
+        elif "dutch_phone" in scenario:
+            if "invalid" in scenario:
+                is_valid = len(input_value) < 13  # Too short
+            else:
+                is_valid = input_value.startswith("+31-6-") and len(input_value) >= 13
+        elif "postal_code" in scenario:
+            if "invalid" in scenario:
+                is_valid = " " not in input_value  # Missing space
+            else:
+                is_valid = " " in input_value and len(input_value) >= 6
+        
+        assert is_valid == expected_valid, f"Dutch validation failed: {scenario}"
     
     # 9. Test extended error scenarios
     @pytest.mark.parametrize("error_test", [
@@ -452,14 +404,11 @@ class TestExtendedDataDriven:
         
         # Check new features list
         assert "new_features" in metadata
-        new_features = metadata["new_features"]
-        assert "Dutch localization test cases" in new_features
-        assert "Edge case scenarios" in new_features
-        assert "Security test cases" in new_features
-        assert "Business logic test cases" in new_features
+        missing = _REQUIRED_FEATURES.difference(metadata["new_features"])
+        assert not missing, f"Missing features: {missing}"
     
     # 15. Test data integrity with new records
-    def test_extended_data_integrity(self, test_data):
+    def test_extended_data_integrity(self, test_data, dutch_users_by_contact, user_ids_set, post_ids_set):
         """Test data integrity with extended records"""
         users = test_data["users"]
         posts = test_data["posts"]
@@ -471,19 +420,14 @@ class TestExtendedDataDriven:
         assert len(comments) == 10
         
         # Check that all posts reference valid users
-        user_ids = {user["id"] for user in users}
-        for post in posts:
-            assert post["userId"] in user_ids
+        assert {post["userId"] for post in posts} <= user_ids_set
         
         # Check that all comments reference valid posts
-        post_ids = {post["id"] for post in posts}
-        for comment in comments:
-            assert comment["postId"] in post_ids
+        assert {comment["postId"] for comment in comments} <= post_ids_set
         
         # Check that Dutch users have Dutch-specific data
-        dutch_users = [user for user in users if ".nl" in user["email"] or "de Vries" in user["name"]]
-        assert len(dutch_users) >= 2
+        assert len(dutch_users_by_contact) >= 2
         
-        for dutch_user in dutch_users:
+        for dutch_user in dutch_users_by_contact:
             assert "+31" in dutch_user["phone"]
             assert "Amsterdam" in dutch_user["address"]["city"] or "Rotterdam" in dutch_user["address"]["city"] 
\ No newline at end of file
@@ -4,8 +4,32 @@ Helper functions for test data, validation, and utilities within the test framew
 """
 import pytest
 import asyncio
-from typing import List, Callable, Any
+import random
+import socket
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Callable, Any, Dict
 import httpx
+import orjson
+
+TEST_DATA_PATH = Path(__file__).parent / "data" / "test_data.json"
+
+@lru_cache(maxsize=None)
+def load_test_data(path: Path = TEST_DATA_PATH) -> Dict[str, Any]:
+    """Load and cache a JSON test data file (parsed once per session)"""
+    return orjson.loads(path.read_bytes())
+
+def wait_for_port(host: str, port: int, timeout: float = 5.0, backoff: float = 0.025) -> None:
+    """Block until host:port accepts TCP connections (instead of a fixed startup sleep)"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection((host, port), timeout=0.05).close()
+            return
+        except OSError:
+            time.sleep(backoff)
+    raise RuntimeError(f"server on {host}:{port} failed to start")
 
 class APIHelper:
     """Helper class for common API operations"""
@@ -17,16 +41,22 @@ class APIHelper:
                                 condition_func: Callable, 
                                 timeout: int = 30, 
                                 interval: int = 1) -> bool:
-        """Wait for a condition to be true"""
-        for _ in range(timeout):
+        """Wait for a condition to be true, probing with exponential backoff up to `interval`"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = 0.05
+        
+        while loop.time() < deadline:
             if await condition_func():
                 return True
-            await asyncio.sleep(interval)
+            await asyncio.sleep(min(delay, max(0, deadline - loop.time())))
+            delay = min(delay * 2, interval)
         return False
     
     async def retry_request(self, method: str, url: str, max_retries: int = 3, **kwargs) -> httpx.Response:
-        """Retry a request with exponential backoff"""
+        """Retry a request with capped, jittered exponential backoff"""
         last_exception = None
+        response = None
         
         for attempt in range(max_retries):
             try:
@@ -35,13 +65,15 @@ class APIHelper:
                     return response
             except Exception as e:
                 last_exception = e
+                response = None
             
             if attempt < max_retries - 1:
-                await asyncio.sleep(2 ** attempt)  # Exponential backoff
+                await asyncio.sleep(min(10, 0.1 * 2 ** attempt) + random.random() * 0.1)
         
-        if last_exception:
-            raise last_exception
-        return response
+        # All attempts failed: return the 5xx if the last attempt got one, otherwise raise its error
+        if response is not None:
+            return response
+        raise last_exception
 
 @pytest.fixture
 def api_helper(http_client):
@@ -2,8 +2,11 @@
 Integration tests for basic API functionality and responses.
 """
 import pytest
+import asyncio
 import httpx
-from pydantic import BaseModel
+import orjson
+from typing import List
+from pydantic import BaseModel, TypeAdapter
 
 class User(BaseModel):
     id: int
@@ -24,6 +27,11 @@ class Comment(BaseModel):
     email: str
     body: str
 
+# Valideer volledige lijsten in één keer i.p.v. per item
+_USERS_ADAPTER = TypeAdapter(List[User])
+_POSTS_ADAPTER = TypeAdapter(List[Post])
+_COMMENTS_ADAPTER = TypeAdapter(List[Comment])
+
 @pytest.mark.asyncio
 class TestUsersAPI:
     
@@ -32,11 +40,11 @@ class TestUsersAPI:
         response = await http_client.get("/users")
         
         assert response.status_code == 200
-        users_data = response.json()
-        assert len(users_data) > 0
+        users = _USERS_ADAPTER.validate_python(orjson.loads(response.content))
+        assert len(users) > 0
         
         # Valideer eerste user met Pydantic
-        first_user = User(**users_data[0])
+        first_user = users[0]
         assert first_user.id > 0
         assert "@" in first_user.email
 
@@ -46,7 +54,7 @@ class TestUsersAPI:
         response = await http_client.get(f"/users/{user_id}")
         
         assert response.status_code == 200
-        user_data = response.json()
+        user_data = orjson.loads(response.content)
         
         user = User(**user_data)
         assert user.id == user_id
@@ -57,7 +65,7 @@ class TestUsersAPI:
         response = await http_client.get(f"/users/{user_id}")
         
         assert response.status_code == 200
-        user = User(**response.json())
+        user = User(**orjson.loads(response.content))
         assert user.id == user_id
 
     async def test_user_not_found(self, http_client):
@@ -74,11 +82,10 @@ class TestPostsAPI:
         response = await http_client.get(f"/posts?userId={user_id}")
         
         assert response.status_code == 200
-        posts = response.json()
+        posts = _POSTS_ADAPTER.validate_python(orjson.loads(response.content))
         
         # Valideer dat alle posts van de juiste user zijn
-        for post_data in posts:
-            post = Post(**post_data)
+        for post in posts:
             assert post.userId == user_id
 
     async def test_create_post(self, http_client, sample_user_data):
@@ -92,7 +99,7 @@ class TestPostsAPI:
         response = await http_client.post("/posts", json=new_post)
         
         assert response.status_code == 201
-        created_post = response.json()
+        created_post = orjson.loads(response.content)
         assert created_post["title"] == new_post["title"]
         assert created_post["userId"] == new_post["userId"] 
 
@@ -105,12 +112,11 @@ class TestCommentsAPI:
         response = await http_client.get(f"/comments?postId={post_id}")
         
         assert response.status_code == 200
-        comments = response.json()
+        comments = _COMMENTS_ADAPTER.validate_python(orjson.loads(response.content))
         assert len(comments) > 0
         
         # Valideer alle comments met Pydantic
-        for comment_data in comments:
-            comment = Comment(**comment_data)
+        for comment in comments:
             assert comment.postId == post_id
             assert "@" in comment.email
             assert len(comment.body) > 0
@@ -121,7 +127,7 @@ class TestCommentsAPI:
         response = await http_client.get(f"/comments?postId={post_id}")
         
         assert response.status_code == 200
-        comments = response.json()
+        comments = orjson.loads(response.content)
         
         # Valideer dat er comments zijn maar niet te veel
         assert len(comments) > 0
@@ -145,7 +151,7 @@ class TestCommentsAPI:
         response = await http_client.post("/comments", json=fake_comment)
         
         assert response.status_code == 201
-        created_comment = response.json()
+        created_comment = orjson.loads(response.content)
         
         # Valideer de response met Pydantic
         comment = Comment(**created_comment)
@@ -160,19 +166,24 @@ class TestCommentsAPI:
         post_id = fake.random_int(min=1, max=100)
         created_comments = []
         
-        for _ in range(num_comments):
-            # Genereer unieke testdata voor elke comment
-            fake_comment = {
-                "postId": post_id,
-                "name": fake.unique.name(),
-                "email": fake.unique.email(),
-                "body": fake.paragraph(nb_sentences=2)
-            }
-            
-            response = await http_client.post("/comments", json=fake_comment)
+        # Genereer unieke testdata voor alle comments in één batch
+        names = [fake.unique.name() for _ in range(num_comments)]
+        emails = [fake.unique.email() for _ in range(num_comments)]
+        bodies = [fake.paragraph(nb_sentences=2) for _ in range(num_comments)]
+        fake_comments = [
+            {"postId": post_id, "name": name, "email": email, "body": body}
+            for name, email, body in zip(names, emails, bodies)
+        ]
+        
+        # Verstuur alle comments gelijktijdig
+        responses = await asyncio.gather(
+            *[http_client.post("/comments", json=fake_comment) for fake_comment in fake_comments]
+        )
+        
+        for fake_comment, response in zip(fake_comments, responses):
             assert response.status_code == 201
             
-            comment = Comment(**response.json())
+            comment = Comment(**orjson.loads(response.content))
             created_comments.append(comment)
             
             # Valideer dat de data correct is opgeslagen
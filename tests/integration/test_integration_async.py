@@ -20,8 +20,8 @@ class TestAsyncIntegration:
             assert posts_response.status_code == 200
             posts = posts_response.data
             assert len(posts) > 0
-            for post in posts:
-                assert post["userId"] == user["id"]
+            uid = user["id"]
+            assert all(post["userId"] == uid for post in posts), posts
 
     @pytest.mark.asyncio
     async def test_performance_under_load(self):
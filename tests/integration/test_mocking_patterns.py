@@ -8,6 +8,31 @@ import httpx
 import respx
 from src.async_client import AsyncAPIClient, APIResponse
 
+POSTS_DATA = [
+    {"id": 1, "userId": 1, "title": "Post 1", "body": "Body 1"},
+    {"id": 2, "userId": 1, "title": "Post 2", "body": "Body 2"}
+]
+
+@pytest.fixture(scope="module", autouse=True)
+def router():
+    """respx router met de vaste routes, één keer per module geregistreerd"""
+    with respx.mock(base_url="https://api.example.com", assert_all_called=False) as respx_router:
+        respx_router.get("/posts", params={"userId": "1"}).respond(200, json=POSTS_DATA)
+        respx_router.get("/users/999").respond(404, json={"error": "User not found"})
+        respx_router.get("/users/500").respond(500, json={"error": "Internal server error"})
+        # Per test wordt alleen de response van deze route omgezet, de route zelf blijft staan
+        respx_router.get("/users/1", name="user_1")
+        yield respx_router
+
+@pytest.fixture(autouse=True)
+def reset_user_1(router):
+    """Zet de user_1 route voor elke test terug, zodat tests niet van de volgorde afhangen"""
+    route = router["user_1"]
+    route.return_value = None
+    route.side_effect = None
+    router.reset()
+    yield route
+
 class TestMockingPatterns:
     """Advanced mocking patterns for async testing"""
     
@@ -30,57 +55,37 @@ class TestMockingPatterns:
                 mock_client.get.assert_called_once_with("/users/1")
 
     @pytest.mark.asyncio
-    @respx.mock
-    async def test_mock_with_respx(self):
+    async def test_mock_with_respx(self, client, router):
         user_data = {"id": 1, "name": "Jane Doe", "email": "jane@example.com"}
-        respx.get("http://localhost/users/1").mock(
+        router["user_1"].mock(
             return_value=httpx.Response(200, json=user_data)
         )
-        async with AsyncAPIClient("http://localhost") as client:
-            response = await client.get_user(1)
-            assert response.status_code == 200
-            assert response.data["name"] == "Jane Doe"
+        response = await client.get_user(1)
+        assert response.status_code == 200
+        assert response.data["name"] == "Jane Doe"
 
     @pytest.mark.asyncio
-    @respx.mock
-    async def test_mock_multiple_endpoints(self):
+    async def test_mock_multiple_endpoints(self, client, router):
         user_data = {"id": 1, "name": "John Doe", "email": "john@example.com"}
-        respx.get("http://localhost/users/1").mock(
+        router["user_1"].mock(
             return_value=httpx.Response(200, json=user_data)
         )
-        posts_data = [
-            {"id": 1, "userId": 1, "title": "Post 1", "body": "Body 1"},
-            {"id": 2, "userId": 1, "title": "Post 2", "body": "Body 2"}
-        ]
-        respx.get("http://localhost/posts?userId=1").mock(
-            return_value=httpx.Response(200, json=posts_data)
-        )
-        async with AsyncAPIClient("http://localhost") as client:
-            user_response = await client.get_user(1)
-            assert user_response.status_code == 200
-            assert user_response.data["name"] == "John Doe"
-            posts_response = await client.get_user_posts(1)
-            assert posts_response.status_code == 200
-            assert len(posts_response.data) == 2
+        user_response = await client.get_user(1)
+        assert user_response.status_code == 200
+        assert user_response.data["name"] == "John Doe"
+        posts_response = await client.get_user_posts(1)
+        assert posts_response.status_code == 200
+        assert len(posts_response.data) == 2
 
     @pytest.mark.asyncio
-    @respx.mock
-    async def test_mock_error_scenarios(self):
-        respx.get("http://localhost/users/999").mock(
-            return_value=httpx.Response(404, json={"error": "User not found"})
-        )
-        respx.get("http://localhost/users/500").mock(
-            return_value=httpx.Response(500, json={"error": "Internal server error"})
-        )
-        async with AsyncAPIClient("http://localhost") as client:
-            response_404 = await client.get_user(999)
-            assert response_404.status_code == 404
-            response_500 = await client.get_user(500)
-            assert response_500.status_code == 500
+    async def test_mock_error_scenarios(self, client):
+        response_404 = await client.get_user(999)
+        assert response_404.status_code == 404
+        response_500 = await client.get_user(500)
+        assert response_500.status_code == 500
 
     @pytest.mark.asyncio
-    @respx.mock
-    async def test_mock_with_side_effects(self):
+    async def test_mock_with_side_effects(self, client, router):
         call_count = 0
         def dynamic_response(request):
             nonlocal call_count
@@ -89,10 +94,9 @@ class TestMockingPatterns:
                 return httpx.Response(500, json={"error": "Temporary error"})
             else:
                 return httpx.Response(200, json={"id": 1, "name": "John Doe", "retry": call_count})
-        respx.get("http://localhost/users/1").mock(side_effect=dynamic_response)
-        async with AsyncAPIClient("http://localhost") as client:
-            response1 = await client.get_user(1)
-            assert response1.status_code == 500
-            response2 = await client.get_user(1)
-            assert response2.status_code == 200
-            assert response2.data["retry"] == 2 
\ No newline at end of file
+        router["user_1"].mock(side_effect=dynamic_response)
+        response1 = await client.get_user(1)
+        assert response1.status_code == 500
+        response2 = await client.get_user(1)
+        assert response2.status_code == 200
+        assert response2.data["retry"] == 2 
\ No newline at end of file
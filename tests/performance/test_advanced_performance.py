@@ -4,54 +4,16 @@ Geavanceerde performance- en loadtests voor API endpoints, inclusief async en rp
 import pytest
 import asyncio
 import time
-from statistics import mean
-import respx
+import numpy as np
 import httpx
 from src.async_client import AsyncAPIClient
 
-@pytest.mark.skip(reason="Unreliable against real endpoints, use mocked test for perf checks")
-@pytest.mark.asyncio
-@pytest.mark.parametrize("n,threshold_rps,threshold_avg", [
-    (10, 1, 1.0),   # Lowered RPS threshold for local/dev
-    (50, 5, 1.5),   # Lowered RPS threshold for local/dev
-    (100, 10, 2.0), # Lowered RPS threshold for local/dev
-])
-async def test_advanced_performance_metrics(n, threshold_rps, threshold_avg):
-    """
-    Voer n gelijktijdige requests uit, meet throughput, min/max/avg response time en error rate.
-    Let op: thresholds zijn verlaagd voor lokale/dev runs. Gebruik de mocked test voor strikte performance checks.
-    """
-    async with AsyncAPIClient(base_url="https://httpbin.org", timeout=5) as client:
-        tasks = [client._session.get("/delay/0.1") for _ in range(n)]
-        start = time.time()
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        elapsed = time.time() - start
-
-    response_times = []
-    errors = 0
-    for r in results:
-        if isinstance(r, Exception):
-            errors += 1
-        else:
-            response_times.append(r.elapsed.total_seconds())
+# Vooraf geserialiseerde body: de MockTransport levert direct een 200, zodat de test
+# de echte client code (httpx request/response pipeline + JSON parsing) meet
+_MOCKED_USER_BODY = b'{"id": 1, "name": "Mocked User"}'
 
-    avg_time = mean(response_times) if response_times else 0
-    min_time = min(response_times) if response_times else 0
-    max_time = max(response_times) if response_times else 0
-    rps = n / elapsed if elapsed > 0 else 0
-    error_rate = errors / n
-
-    print(f"Total requests: {n}")
-    print(f"Total time: {elapsed:.3f}s")
-    print(f"Requests per second: {rps:.1f}")
-    print(f"Avg response time: {avg_time:.3f}s")
-    print(f"Min response time: {min_time:.3f}s")
-    print(f"Max response time: {max_time:.3f}s")
-    print(f"Errors: {errors} ({error_rate:.1%})")
-
-    assert rps >= threshold_rps, f"Throughput te laag: {rps:.1f} < {threshold_rps}"
-    assert avg_time <= threshold_avg * 1.5, f"Gemiddelde response time te hoog: {avg_time:.3f} > {threshold_avg * 1.5}"
-    assert error_rate < 0.1, f"Te veel errors: {errors} van {n}"
+def _mocked_user_handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, content=_MOCKED_USER_BODY, headers={"content-type": "application/json"})
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize("n,threshold_rps,threshold_avg", [
@@ -59,26 +21,30 @@ async def test_advanced_performance_metrics(n, threshold_rps, threshold_avg):
     (50, 100, 0.1),
     (100, 200, 0.1),
 ])
-@respx.mock
 async def test_mocked_performance_metrics(n, threshold_rps, threshold_avg):
     """
     Mocked performance test: alle requests krijgen direct een 200 response.
     """
-    respx.get("https://api.example.com/users/1").mock(
-        return_value=httpx.Response(200, json={"id": 1, "name": "Mocked User"})
-    )
-    async with AsyncAPIClient(base_url="https://api.example.com", timeout=5) as client:
-        tasks = [client.get_user(1) for _ in range(n)]
-        start = time.time()
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        elapsed = time.time() - start
-
-    response_times = [r.response_time for r in results if not isinstance(r, Exception)]
-    errors = sum(1 for r in results if isinstance(r, Exception))
-
-    avg_time = mean(response_times) if response_times else 0
-    min_time = min(response_times) if response_times else 0
-    max_time = max(response_times) if response_times else 0
+    times = np.empty(n, dtype=np.float64)
+    completed = 0
+    errors = 0
+    transport = httpx.MockTransport(_mocked_user_handler)
+    async with AsyncAPIClient(base_url="https://api.example.com", timeout=5, transport=transport) as client:
+        start = time.perf_counter()
+        tasks = [asyncio.create_task(client.get_user(1)) for _ in range(n)]
+        # Verwerk responses zodra ze binnenkomen, zodat ze direct vrijgegeven kunnen worden
+        for fut in asyncio.as_completed(tasks):
+            try:
+                times[completed] = (await fut).response_time
+                completed += 1
+            except Exception:
+                errors += 1
+        elapsed = time.perf_counter() - start
+
+    response_times = times[:completed]
+    avg_time = response_times.mean() if completed else 0
+    min_time = response_times.min() if completed else 0
+    max_time = response_times.max() if completed else 0
     rps = n / elapsed if elapsed > 0 else 0
     error_rate = errors / n
 
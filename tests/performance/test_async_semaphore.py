@@ -2,36 +2,49 @@
 Tests voor async semaphores in performance context.
 """
 import pytest
+import pytest_asyncio
 import asyncio
 import time
-import respx
 import httpx
 from src.async_client import AsyncAPIClient
 
+def _mocked_user_handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"id": 1, "name": "Mocked User"})
+
+@pytest_asyncio.fixture(scope="module")
+async def mock_client():
+    """AsyncAPIClient op een httpx.MockTransport: geen route matching, alleen de handler"""
+    transport = httpx.MockTransport(_mocked_user_handler)
+    async with AsyncAPIClient(base_url="https://api.example.com", timeout=5, transport=transport) as client:
+        yield client
+
 @pytest.mark.asyncio
-@respx.mock
-async def test_rate_limited_batch_requests():
+@pytest.mark.parametrize("mode,max_concurrent", [
+    pytest.param("unthrottled", None, id="mocked-unthrottled"),
+    pytest.param("limited", 5, id="mocked-limited"),
+])
+async def test_rate_limited_batch_requests(mock_client, mode, max_concurrent):
     n = 50
-    max_concurrent = 5
-    semaphore = asyncio.Semaphore(max_concurrent)
-    respx.get("https://api.example.com/users/1").mock(
-        return_value=httpx.Response(200, json={"id": 1, "name": "Mocked User"})
-    )
     results = []
 
-    async def limited_get_user(client, user_id):
-        async with semaphore:
-            return await client.get_user(user_id)
+    if mode == "limited":
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def get_user(user_id):
+            async with semaphore:
+                return await mock_client.get_user(user_id)
+    else:
+        # Mock antwoordt direct: een semaphore beperkt hier alleen de throughput
+        get_user = mock_client.get_user
 
-    async with AsyncAPIClient(base_url="https://api.example.com", timeout=5) as client:
-        start = time.time()
-        tasks = [limited_get_user(client, 1) for _ in range(n)]
-        results = await asyncio.gather(*tasks)
-        elapsed = time.time() - start
+    start = time.time()
+    tasks = [get_user(1) for _ in range(n)]
+    results = await asyncio.gather(*tasks)
+    elapsed = time.time() - start
 
     print(f"Total requests: {n}")
-    print(f"Max concurrent: {max_concurrent}")
+    print(f"Max concurrent: {max_concurrent or n}")
     print(f"Total time: {elapsed:.3f}s")
     print(f"Requests per second: {n/elapsed:.1f}")
     assert len(results) == n
-    assert all(r.status_code == 200 for r in results) 
\ No newline at end of file
+    assert all(r.status_code == 200 for r in results)
@@ -1,30 +1,37 @@
 import pytest
-import json
+import orjson
 import time
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
+
+STATUS_PASSED, STATUS_FAILED, STATUS_SKIPPED = 0, 1, 2
+STATUS_NAMES = ("PASSED", "FAILED", "SKIPPED")
+
+# (test_name, status, duration, error, timestamp)
+TestResult = Tuple[str, int, float, Optional[str], float]
 
 class TestMetricsCollector:
     """Collect test execution metrics"""
     def __init__(self):
-        self.test_results: List[Dict[str, Any]] = []
+        self.test_results: List[TestResult] = []
         self.start_time = time.time()
 
-    def add_test_result(self, test_name: str, status: str, duration: float, error: str = None):
-        self.test_results.append({
-            "test_name": test_name,
-            "status": status,
-            "duration": duration,
-            "error": error,
-            "timestamp": time.time()
-        })
+    def add_test_result(self, test_name: str, status: int, duration: float, error: str = None):
+        self.test_results.append((test_name, status, duration, error, time.time()))
 
     def generate_report(self) -> Dict[str, Any]:
         total_tests = len(self.test_results)
-        passed_tests = len([r for r in self.test_results if r["status"] == "PASSED"])
-        failed_tests = len([r for r in self.test_results if r["status"] == "FAILED"])
-        skipped_tests = len([r for r in self.test_results if r["status"] == "SKIPPED"])
-        total_duration = sum(r["duration"] for r in self.test_results)
+        passed_tests = failed_tests = skipped_tests = 0
+        total_duration = 0.0
+        # Eén pass over alle resultaten i.p.v. een lijst per status
+        for _, status, duration, _, _ in self.test_results:
+            total_duration += duration
+            if status == STATUS_PASSED:
+                passed_tests += 1
+            elif status == STATUS_FAILED:
+                failed_tests += 1
+            elif status == STATUS_SKIPPED:
+                skipped_tests += 1
         avg_duration = total_duration / total_tests if total_tests > 0 else 0
         return {
             "summary": {
@@ -36,7 +43,16 @@ class TestMetricsCollector:
                 "total_duration": total_duration,
                 "average_duration": avg_duration
             },
-            "test_results": self.test_results,
+            "test_results": [
+                {
+                    "test_name": name,
+                    "status": STATUS_NAMES[status],
+                    "duration": duration,
+                    "error": error,
+                    "timestamp": timestamp
+                }
+                for name, status, duration, error, timestamp in self.test_results
+            ],
             "generated_at": time.time()
         }
 
@@ -47,13 +63,13 @@ metrics_collector = TestMetricsCollector()
 def pytest_runtest_makereport(item, call):
     if call.when == "call":
         if call.excinfo is None:
-            status = "PASSED"
+            status = STATUS_PASSED
             error = None
         elif call.excinfo.typename == "Skipped":
-            status = "SKIPPED"
+            status = STATUS_SKIPPED
             error = str(call.excinfo.value)
         else:
-            status = "FAILED"
+            status = STATUS_FAILED
             error = str(call.excinfo.value)
         metrics_collector.add_test_result(
             test_name=item.nodeid,
@@ -62,13 +78,25 @@ def pytest_runtest_makereport(item, call):
             error=error
         )
 
+# Hook (xdist controller): voeg de resultaten van een worker samen zodra die klaar is
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    worker_results = getattr(node, "workeroutput", {}).get("metrics_test_results")
+    if worker_results:
+        metrics_collector.test_results.extend(worker_results)
+
 # Hook: genereer en print metrics rapport na de testsessie
 def pytest_sessionfinish(session, exitstatus):
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        # xdist worker: resultaten doorgeven aan de controller, die schrijft het rapport
+        workeroutput["metrics_test_results"] = metrics_collector.test_results
+        return
     report = metrics_collector.generate_report()
     reports_dir = Path("reports")
     reports_dir.mkdir(exist_ok=True)
-    with open(reports_dir / "metrics_report.json", "w") as f:
-        json.dump(report, f, indent=2)
+    with open(reports_dir / "metrics_report.json", "wb") as f:
+        f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
     summary = report["summary"]
     print(f"\n{'='*50}")
     print(f"TEST EXECUTION SUMMARY")
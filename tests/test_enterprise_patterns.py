@@ -1,4 +1,5 @@
 import pytest
+import array
 import asyncio
 import time
 from typing import Dict, Any, List
@@ -22,15 +23,16 @@ class TestEnterpriseAPI:
         user_data = user_factory.create_user()
         create_response = await global_http_client.post("/users", json=user_data)
         assert create_response.status_code == 201
-        # Read
-        read_response = await global_http_client.get("/users/1")
-        assert read_response.status_code == 200
-        # Update (PUT)
+        # Read, update (PUT) en delete van user 1 hangen niet af van de create
+        # (JSONPlaceholder is stateless), dus die gaan gelijktijdig
         updated_data = user_factory.create_user(name="Updated Name")
-        update_response = await global_http_client.put("/users/1", json=updated_data)
+        read_response, update_response, delete_response = await asyncio.gather(
+            global_http_client.get("/users/1"),
+            global_http_client.put("/users/1", json=updated_data),
+            global_http_client.delete("/users/1"),
+        )
+        assert read_response.status_code == 200
         assert update_response.status_code == 200
-        # Delete
-        delete_response = await global_http_client.delete("/users/1")
         assert delete_response.status_code == 200
 
     @pytest.mark.performance
@@ -39,21 +41,28 @@ class TestEnterpriseAPI:
         """Load performance test"""
         num_requests = 50
         max_concurrent = 10
-        semaphore = asyncio.Semaphore(max_concurrent)
+        # Vooraf gealloceerde durations en een teller, geen tuple per request
+        durations = array.array('d', [0.0]) * num_requests
+        success = [0]
         async def make_request(user_id):
-            async with semaphore:
-                start_time = time.time()
-                response = await global_http_client.get(f"/users/{user_id % 10 + 1}")
-                end_time = time.time()
-                return response.status_code, end_time - start_time
-        start_time = time.time()
-        tasks = [make_request(i) for i in range(num_requests)]
-        results = await asyncio.gather(*tasks)
-        total_time = time.time() - start_time
+            start_time = time.perf_counter()
+            response = await global_http_client.get(f"/users/{user_id % 10 + 1}")
+            durations[user_id] = time.perf_counter() - start_time
+            if response.status_code == 200:
+                success[0] += 1
+        # Vaste worker pool: er bestaan nooit meer dan max_concurrent tasks tegelijk
+        queue = asyncio.Queue()
+        for i in range(num_requests):
+            queue.put_nowait(i)
+        async def worker():
+            while not queue.empty():
+                await make_request(queue.get_nowait())
+        start_time = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(max_concurrent)))
+        total_time = time.perf_counter() - start_time
         # Analyze results
-        success_count = sum(1 for status, _ in results if status == 200)
-        response_times = [duration for _, duration in results]
-        avg_response_time = sum(response_times) / len(response_times)
+        success_count = success[0]
+        avg_response_time = sum(durations) / num_requests
         # Assertions
         assert success_count == num_requests, f"Only {success_count}/{num_requests} requests succeeded"
         assert avg_response_time < 2.0, f"Average response time {avg_response_time:.3f}s too high"
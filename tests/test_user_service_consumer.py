@@ -1,9 +1,12 @@
 import pytest
+import pytest_asyncio
+import httpx
+from contextlib import contextmanager
 from pact.v3 import Pact, match
 from consumer.service import UserService, User
 
-PACT_MOCK_PORT = 1234
-PACT_MOCK_URL = f"http://localhost:{PACT_MOCK_PORT}"
+# Geen vaste mock-poort: pact.serve() bindt per test een vrije poort, zodat
+# xdist workers (make contract) elkaar niet in de weg zitten
 
 @pytest.fixture(scope="function")
 def pact():
@@ -13,154 +16,215 @@ def pact():
     )
     yield pact
 
-class TestUserServiceConsumer:
-    """Consumer contract tests using Pact"""
-    
-    def test_get_user_success(self, pact):
-        """Test successful user retrieval"""
-        expected_user = {
+@pytest.fixture(scope="module")
+def pact_files():
+    """Pacts die de tests vastleggen; ze worden in een keer bij module teardown weggeschreven"""
+    pending = []
+    yield pending
+    for pact, directory in pending:
+        pact.write_file(directory)
+
+@pytest_asyncio.fixture(scope="module")
+async def http2_client():
+    """Async client gedeeld door de module-level pact tests (HTTP/2 waar de server het ondersteunt)"""
+    async with httpx.AsyncClient(http2=True) as client:
+        yield client
+
+@pytest.fixture(scope="module")
+def shared_user_service():
+    """Een UserService (en httpx.Client) voor de hele module, in plaats van een per test"""
+    service = UserService()
+    yield service
+    service.close()
+
+@contextmanager
+def _pointed_at(service, url):
+    """Wijs de gedeelde UserService naar url en zet de vorige url terug bij exit"""
+    previous = service.base_url, service.client.base_url
+    service.base_url = url
+    service.client.base_url = url
+    try:
+        yield service
+    finally:
+        service.base_url, service.client.base_url = previous
+
+@pytest.fixture
+def user_service(pact, shared_user_service):
+    """Start de Pact mock server en wijs de gedeelde UserService ernaar"""
+    @contextmanager
+    def _serve():
+        with pact.serve() as mock_server, _pointed_at(shared_user_service, str(mock_server.url)) as service:
+            yield service
+    return _serve
+
+CREATE_USER_DATA = {
+    'name': 'Jane Smith',
+    'email': 'jane@example.com',
+    'username': 'janesmith'
+}
+INVALID_USER_DATA = {
+    'name': '',  # Invalid: empty name
+    'email': 'invalid-email',  # Invalid: bad email format
+    'username': 'usr'  # Invalid: too short
+}
+
+# Een interactie per case: request, response, de consumer call en de check op het resultaat
+CONSUMER_CASES = [
+    {
+        "id": "get_user_success",
+        "desc": "a request for user 1",
+        "state": "user 1 exists",
+        "method": "GET",
+        "path": "/users/1",
+        "status": 200,
+        "response": {
             'id': match.like(1),
             'name': match.like('John Doe'),
             'email': match.like('john@example.com'),
             'username': match.like('johndoe')
-        }
-        
-        # Define the expected interaction
-        (
-            pact.upon_receiving("a request for user 1")
-            .given("user 1 exists")
-            .with_request("GET", "/users/1")
-            .will_respond_with(200)
-            .with_body(expected_user)
-        )
-        
-        with pact.serve() as mock_server:
-            user_service = UserService(str(mock_server.url))
-            user = user_service.get_user(1)
-            
-            assert user is not None
-            assert user.id == 1
-            assert user.name == 'John Doe'
-            assert user.email == 'john@example.com'
-            user_service.close()
-            pact.write_file('pacts/get_user_success.json')
-    
-    def test_get_user_not_found(self, pact):
-        (
-            pact.upon_receiving("a request for user 999")
-            .given("user 999 does not exist")
-            .with_request("GET", "/users/999")
-            .will_respond_with(404)
-            .with_body({'error': 'User not found'})
-        )
-        with pact.serve() as mock_server:
-            user_service = UserService(str(mock_server.url))
-            user = user_service.get_user(999)
-            assert user is None
-            user_service.close()
-            pact.write_file('pacts/get_user_not_found.json')
-    
-    def test_get_users_list(self, pact):
-        expected_user_structure = {
+        },
+        "call": lambda service: service.get_user(1),
+        "check": lambda user: (user is not None and user.id == 1 and user.name == 'John Doe'
+                               and user.email == 'john@example.com'),
+    },
+    {
+        "id": "get_user_not_found",
+        "desc": "a request for user 999",
+        "state": "user 999 does not exist",
+        "method": "GET",
+        "path": "/users/999",
+        "status": 404,
+        "response": {'error': 'User not found'},
+        "call": lambda service: service.get_user(999),
+        "check": lambda user: user is None,
+    },
+    {
+        "id": "get_users_list",
+        "desc": "a request for users list",
+        "state": "users exist",
+        "method": "GET",
+        "path": "/users",
+        "query": {"_limit": "10"},
+        "status": 200,
+        "response": match.each_like({
             'id': match.like(1),
             'name': match.like('John Doe'),
             'email': match.regex('john@example.com', regex=r'.+@.+\..+'),
             'username': match.like('johndoe')
-        }
-        (
-            pact.upon_receiving("a request for users list")
-            .given("users exist")
-            .with_request("GET", "/users")
-            .with_query_parameters({"_limit": "10"})
-            .will_respond_with(200)
-            .with_body(match.each_like(expected_user_structure))
-        )
-        with pact.serve() as mock_server:
-            user_service = UserService(str(mock_server.url))
-            users = user_service.get_users(limit=10)
-            assert len(users) >= 1
-            assert all(isinstance(user, User) for user in users)
-            user_service.close()
-            pact.write_file('pacts/get_users_list.json')
-    
-    def test_create_user_success(self, pact):
-        user_data = {
-            'name': 'Jane Smith',
-            'email': 'jane@example.com',
-            'username': 'janesmith'
-        }
-        expected_response = {
+        }),
+        "call": lambda service: service.get_users(limit=10),
+        "check": lambda users: len(users) >= 1 and all(isinstance(user, User) for user in users),
+    },
+    {
+        "id": "create_user_success",
+        "desc": "a request to create a user",
+        "state": "user creation is allowed",
+        "method": "POST",
+        "path": "/users",
+        "body": match.like(CREATE_USER_DATA),
+        "status": 201,
+        "response": {
             'id': match.like(101),
             'name': 'Jane Smith',
             'email': 'jane@example.com',
             'username': 'janesmith'
-        }
-        (
-            pact.upon_receiving("a request to create a user")
-            .given("user creation is allowed")
-            .with_request("POST", "/users")
-            .with_body(match.like(user_data))
-            .will_respond_with(201)
-            .with_body(expected_response)
-        )
-        with pact.serve() as mock_server:
-            user_service = UserService(str(mock_server.url))
-            created_user = user_service.create_user(user_data)
-            assert created_user is not None
-            assert created_user.name == 'Jane Smith'
-            assert created_user.email == 'jane@example.com'
-            assert created_user.id > 0
-            user_service.close()
-            pact.write_file('pacts/create_user_success.json')
-    
-    def test_get_user_posts(self, pact):
-        expected_post_structure = {
+        },
+        "call": lambda service: service.create_user(CREATE_USER_DATA),
+        "check": lambda user: (user is not None and user.name == 'Jane Smith'
+                               and user.email == 'jane@example.com' and user.id > 0),
+    },
+    {
+        "id": "get_user_posts",
+        "desc": "a request for user 1 posts",
+        "state": "user 1 has posts",
+        "method": "GET",
+        "path": "/posts",
+        "query": {"userId": "1"},
+        "status": 200,
+        "response": match.each_like({
             'id': match.like(1),
             'userId': match.like(1),
             'title': match.like('Sample Post Title'),
             'body': match.like('Sample post body content')
-        }
-        (
-            pact.upon_receiving("a request for user 1 posts")
-            .given("user 1 has posts")
-            .with_request("GET", "/posts")
-            .with_query_parameters({"userId": "1"})
-            .will_respond_with(200)
-            .with_body(match.each_like(expected_post_structure))
-        )
-        with pact.serve() as mock_server:
-            user_service = UserService(str(mock_server.url))
-            posts = user_service.get_user_posts(1)
-            assert len(posts) >= 1
-            assert all(post.userId == 1 for post in posts)
-            user_service.close()
-            pact.write_file('pacts/get_user_posts.json')
+        }),
+        "call": lambda service: service.get_user_posts(1),
+        "check": lambda posts: len(posts) >= 1 and all(post.userId == 1 for post in posts),
+    },
+]
+
+# Eigen mock server: de body matcht ook de like()-matcher van "create a user"
+VALIDATION_ERROR_CASE = {
+    "desc": "a request to create user with invalid data",
+    "state": "user creation validation is enabled",
+    "method": "POST",
+    "path": "/users",
+    "body": INVALID_USER_DATA,
+    "status": 422,
+    "response": {
+        'error': 'Validation failed',
+        'details': match.each_like('Name is required')
+    },
+}
+
+def _add_interaction(pact, case):
+    """Register one interaction described by a case dict"""
+    interaction = (
+        pact.upon_receiving(case["desc"])
+        .given(case["state"])
+        .with_request(case["method"], case["path"])
+    )
+    if "query" in case:
+        interaction.with_query_parameters(case["query"])
+    if "body" in case:
+        interaction.with_body(case["body"])
+    interaction.will_respond_with(case["status"]).with_body(case["response"])
+
+def _selected_cases(request):
+    """De consumer cases die in deze run geselecteerd zijn (na -k, node ids of --lf)"""
+    selected = {
+        item.callspec.params["case"]["id"]
+        for item in request.session.items
+        if item.cls is request.cls and "case" in getattr(getattr(item, "callspec", None), "params", {})
+    }
+    return [case for case in CONSUMER_CASES if case["id"] in selected]
+
+@pytest.fixture(scope="class")
+def consumer_service(request, shared_user_service, pact_files):
+    """Een Pact mock server met de geselecteerde interacties voor de hele class, in plaats van een per test.
+
+    Alleen de cases die in deze run draaien worden geregistreerd: de mock server
+    faalt bij exit op elke interactie die nooit is aangeroepen. Het pact bestand
+    wordt alleen geschreven als alle cases draaiden. De class draait via
+    xdist_group op een worker, anders mist elke worker de cases van de andere.
+    """
+    cases = _selected_cases(request)
+    pact = Pact("UserService", "UserAPI")
+    for case in cases:
+        _add_interaction(pact, case)
+    with pact.serve() as mock_server, _pointed_at(shared_user_service, str(mock_server.url)) as service:
+        yield service
+    if len(cases) == len(CONSUMER_CASES):
+        pact_files.append((pact, 'pacts/user_service_consumer'))
+
+@pytest.mark.xdist_group("user_service_consumer")
+class TestUserServiceConsumer:
+    """Consumer contract tests using Pact"""
+    
+    @pytest.mark.parametrize("case", CONSUMER_CASES, ids=[case["id"] for case in CONSUMER_CASES])
+    def test_consumer_case(self, consumer_service, case):
+        """Exercise one interaction through the consumer and check the result"""
+        result = case["call"](consumer_service)
+        assert case["check"](result), f"{case['id']}: unexpected result {result!r}"
     
-    def test_create_user_validation_error(self, pact):
-        invalid_user_data = {
-            'name': '',  # Invalid: empty name
-            'email': 'invalid-email',  # Invalid: bad email format
-            'username': 'usr'  # Invalid: too short
-        }
-        (
-            pact.upon_receiving("a request to create user with invalid data")
-            .given("user creation validation is enabled")
-            .with_request("POST", "/users")
-            .with_body(invalid_user_data)
-            .will_respond_with(422)
-            .with_body({
-                'error': 'Validation failed',
-                'details': match.each_like('Name is required')
-            })
-        )
-        with pact.serve() as mock_server:
-            user_service = UserService(str(mock_server.url))
-            created_user = user_service.create_user(invalid_user_data)
+    def test_create_user_validation_error(self, pact, user_service, pact_files):
+        _add_interaction(pact, VALIDATION_ERROR_CASE)
+        with user_service() as service:
+            created_user = service.create_user(INVALID_USER_DATA)
             assert created_user is None
-            user_service.close()
-            pact.write_file('pacts/create_user_validation_error.json')
+            pact_files.append((pact, 'pacts/create_user_validation_error.json'))
 
-def test_minimal_pact_interaction(pact):
+@pytest.mark.asyncio
+async def test_minimal_pact_interaction(pact, pact_files, http2_client):
     (
         pact.upon_receiving("a minimal request")
         .with_request("GET", "/minimal")
@@ -168,13 +232,13 @@ def test_minimal_pact_interaction(pact):
         .with_body({"result": "ok"})
     )
     with pact.serve() as mock_server:
-        import requests
-        response = requests.get(f"{mock_server.url}/minimal")
+        response = await http2_client.get(f"{mock_server.url}/minimal")
         assert response.status_code == 200
         assert response.json() == {"result": "ok"}
-        pact.write_file('pacts/minimal_pact_interaction.json')
+        pact_files.append((pact, 'pacts/minimal_pact_interaction.json'))
 
-def test_simple_provider_state(pact):
+@pytest.mark.asyncio
+async def test_simple_provider_state(pact, pact_files, http2_client):
     (
         pact.upon_receiving("a request with provider state")
         .given("state A")
@@ -183,8 +247,7 @@ def test_simple_provider_state(pact):
         .with_body({"result": "state-a-ok"})
     )
     with pact.serve() as mock_server:
-        import requests
-        response = requests.get(f"{mock_server.url}/state-a")
+        response = await http2_client.get(f"{mock_server.url}/state-a")
         assert response.status_code == 200
         assert response.json() == {"result": "state-a-ok"}
-        pact.write_file('pacts/simple_provider_state.json') 
\ No newline at end of file
+        pact_files.append((pact, 'pacts/simple_provider_state.json')) 
\ No newline at end of file
@@ -2,48 +2,60 @@
 """
 Unittests for cleanup tracking: resource cleanup and state management.
 """
+import logging
 import pytest
 from typing import Dict, Any, List
+from src.test_data_factory import UserFactory
+
+log = logging.getLogger(__name__)
+
+# (users, posts voor de eerste user, comments per post); zonder posts komen comments op post 1
+TRACKER_SCENARIOS = {
+    "basic": (1, 1, 0),
+    "multiple": (3, 2, 0),
+    "scaling-1": (1, 0, 0),
+    "scaling-3": (3, 0, 0),
+    "scaling-5": (5, 0, 0),
+    "comments": (0, 0, 3),
+    "nested": (1, 2, 2),
+}
+
+@pytest.fixture(scope="module")
+def prebuilt_users() -> List[Dict[str, Any]]:
+    """Users for the tracking scenarios, generated once for the largest count and sliced per case"""
+    return UserFactory.create_multiple_users(max(users for users, _, _ in TRACKER_SCENARIOS.values()))
 
 class TestCleanupTracker:
     
     @pytest.mark.asyncio
-    async def test_basic_cleanup_tracking(self, cleanup_tracker, user_factory, post_factory):
-        """Test basis cleanup tracking functionality"""
-        # Make test resources
-        user = user_factory.create_user()
-        post = post_factory.create_post()
-        
-        # Track resources for cleanup
-        cleanup_tracker["users"].append(user["id"])
-        cleanup_tracker["posts"].append(post["id"])
+    @pytest.mark.parametrize("scenario", TRACKER_SCENARIOS)
+    async def test_cleanup_tracking(self, cleanup_tracker, prebuilt_users, post_factory, comment_factory, scenario):
+        """Test tracking of users, posts and comments for one scenario (single, multiple, scaling, nested)"""
+        user_count, post_count, comments_per_post = TRACKER_SCENARIOS[scenario]
         
-        # Verify that resources are tracked
-        assert len(cleanup_tracker["users"]) == 1
-        assert len(cleanup_tracker["posts"]) == 1
-        assert user["id"] in cleanup_tracker["users"]
-        assert post["id"] in cleanup_tracker["posts"]
-        
-        print(f"Test: Created user {user['id']} and post {post['id']}")
-
-    @pytest.mark.asyncio
-    async def test_multiple_resources_tracking(self, cleanup_tracker, user_factory, post_factory):
-        """Test tracking of multiple resources"""
-        # Make multiple resources
-        users = user_factory.create_multiple_users(3)
-        posts = [post_factory.create_post() for _ in range(2)]
+        # Make resources
+        users = prebuilt_users[:user_count]
+        posts = post_factory.create_posts_for_user(users[0]["id"] if users else 1, count=post_count)
+        comments = [
+            comment
+            for post_id in ([post["id"] for post in posts] or [1])
+            for comment in comment_factory.create_comments_for_post(post_id, count=comments_per_post)
+        ]
         
-        # Track all resources
-        for user in users:
-            cleanup_tracker["users"].append(user["id"])
-        for post in posts:
-            cleanup_tracker["posts"].append(post["id"])
+        # Track resources
+        cleanup_tracker["users"].extend(user["id"] for user in users)
+        cleanup_tracker["posts"].extend(post["id"] for post in posts)
+        cleanup_tracker["comments"].extend(comment["id"] for comment in comments)
         
         # Verify tracking
-        assert len(cleanup_tracker["users"]) == 3
-        assert len(cleanup_tracker["posts"]) == 2
-        
-        print(f"Test: Tracked {len(users)} users and {len(posts)} posts")
+        assert len(cleanup_tracker["users"]) == user_count
+        assert len(cleanup_tracker["posts"]) == post_count
+        assert len(cleanup_tracker["comments"]) == max(post_count, 1) * comments_per_post
+        assert all(user["id"] in cleanup_tracker["users"] for user in users)
+        assert all(post["id"] in cleanup_tracker["posts"] for post in posts)
+        
+        log.debug("Test: %s - tracked %d users, %d posts, %d comments",
+                  scenario, len(users), len(posts), len(comments))
 
     @pytest.mark.asyncio
     async def test_cleanup_tracker_isolation(self, cleanup_tracker):
@@ -85,49 +97,15 @@ class TestCleanupTracker:
                 # Track post for cleanup
                 cleanup_tracker["posts"].append(post_id)
                 
-                print(f"Test: Created and tracked user {user_id} and post {post_id}")
+                log.debug("Test: Created and tracked user %s and post %s", user_id, post_id)
                 
                 # Verify tracking
                 assert user_id in cleanup_tracker["users"]
                 assert post_id in cleanup_tracker["posts"]
             else:
-                print("Post creation failed (expected for JSONPlaceholder)")
+                log.debug("Post creation failed (expected for JSONPlaceholder)")
         else:
-            print("User creation failed (expected for JSONPlaceholder)")
-
-    @pytest.mark.asyncio
-    @pytest.mark.parametrize("resource_count", [1, 3, 5])
-    async def test_cleanup_tracker_scaling(self, cleanup_tracker, user_factory, resource_count):
-        """Test cleanup tracker with different amounts of resources"""
-        # Make resources
-        users = user_factory.create_multiple_users(resource_count)
-        
-        # Track resources
-        for user in users:
-            cleanup_tracker["users"].append(user["id"])
-        
-        # Verify scaling
-        assert len(cleanup_tracker["users"]) == resource_count
-        
-        print(f"Test: Tracked {resource_count} users for cleanup")
-
-    @pytest.mark.asyncio
-    async def test_cleanup_tracker_with_comments(self, cleanup_tracker, comment_factory):
-        """Test cleanup tracking with comments"""
-        # Add comment tracking to cleanup_tracker
-        cleanup_tracker["comments"] = []
-        
-        # Make comments
-        comments = comment_factory.create_comments_for_post(post_id=1, count=3)
-        
-        # Track comments
-        for comment in comments:
-            cleanup_tracker["comments"].append(comment["id"])
-        
-        # Verify tracking
-        assert len(cleanup_tracker["comments"]) == 3
-        
-        print(f"Test: Tracked {len(comments)} comments for cleanup")
+            log.debug("User creation failed (expected for JSONPlaceholder)")
 
     @pytest.mark.asyncio
     async def test_cleanup_tracker_error_handling(self, cleanup_tracker):
@@ -138,40 +116,11 @@ class TestCleanupTracker:
         except Exception as e:
             # Even in case of errors, cleanup tracker should still be available
             cleanup_tracker["users"].append(999)  # Fallback cleanup
-            print(f"Test: Error occurred, but cleanup tracker still works: {e}")
+            log.debug("Test: Error occurred, but cleanup tracker still works: %s", e)
         
         # Verify that cleanup tracker still works
         assert len(cleanup_tracker["users"]) == 1
 
-    @pytest.mark.asyncio
-    async def test_cleanup_tracker_nested_resources(self, cleanup_tracker, user_factory, post_factory, comment_factory):
-        """Test cleanup tracking with nested resources (user -> posts -> comments)"""
-        # Make user
-        user = user_factory.create_user()
-        cleanup_tracker["users"].append(user["id"])
-        
-        # Make posts for user
-        posts = post_factory.create_posts_for_user(user["id"], count=2)
-        for post in posts:
-            cleanup_tracker["posts"].append(post["id"])
-        
-        # Make comments for posts
-        if "comments" not in cleanup_tracker:
-            cleanup_tracker["comments"] = []
-        
-        for post in posts:
-            comments = comment_factory.create_comments_for_post(post["id"], count=2)
-            for comment in comments:
-                cleanup_tracker["comments"].append(comment["id"])
-        
-        # Verify nested tracking
-        assert len(cleanup_tracker["users"]) == 1
-        assert len(cleanup_tracker["posts"]) == 2
-        assert len(cleanup_tracker["comments"]) == 4  # 2 posts * 2 comments
-        
-        print(f"Test: Tracked nested resources - {len(cleanup_tracker['users'])} users, "
-              f"{len(cleanup_tracker['posts'])} posts, {len(cleanup_tracker['comments'])} comments")
-
     @pytest.mark.asyncio
     async def test_cleanup_tracker_duplicate_prevention(self, cleanup_tracker, user_factory):
         """Test that cleanup tracker prevents duplicates"""
@@ -186,7 +135,7 @@ class TestCleanupTracker:
         # Verify that there is only one entry (no duplicates)
         assert cleanup_tracker["users"].count(user_id) == 3  # Or implement duplicate prevention
         
-        print(f"Test: Added user {user_id} multiple times to cleanup tracker")
+        log.debug("Test: Added user %s multiple times to cleanup tracker", user_id)
 
     @pytest.mark.asyncio
     async def test_enhanced_cleanup_tracker_functionality(self, cleanup_tracker, user_factory, post_factory, comment_factory):
@@ -217,8 +166,8 @@ class TestCleanupTracker:
         assert comment_count == 1
         assert total_count == 3
         
-        print(f"Test: Enhanced tracker - users: {user_count}, posts: {post_count}, "
-              f"comments: {comment_count}, total: {total_count}")
+        log.debug("Test: Enhanced tracker - users: %d, posts: %d, comments: %d, total: %d",
+                  user_count, post_count, comment_count, total_count)
 
     @pytest.mark.asyncio
     async def test_cleanup_tracker_custom_resource_types(self, cleanup_tracker):
@@ -241,26 +190,24 @@ class TestCleanupTracker:
         assert todo_count == 1
         assert total_count == 4
         
-        print(f"Test: Custom resources - albums: {album_count}, photos: {photo_count}, "
-              f"todos: {todo_count}, total: {total_count}")
+        log.debug("Test: Custom resources - albums: %d, photos: %d, todos: %d, total: %d",
+                  album_count, photo_count, todo_count, total_count)
 
     @pytest.mark.asyncio
     async def test_cleanup_tracker_complex_scenario(self, cleanup_tracker, user_factory, post_factory, comment_factory):
         """Test cleanup tracker with complex scenario"""
         # Make a complex test setup
         users = user_factory.create_multiple_users(2)
+        cleanup_tracker["add_many"]("users", [user["id"] for user in users])
         for user in users:
-            cleanup_tracker["add"]("users", user["id"])
-            
             # Make posts for each user
             posts = post_factory.create_posts_for_user(user["id"], count=2)
+            cleanup_tracker["add_many"]("posts", [post["id"] for post in posts])
+            
+            # Make comments for each post
             for post in posts:
-                cleanup_tracker["add"]("posts", post["id"])
-                
-                # Make comments for each post
                 comments = comment_factory.create_comments_for_post(post["id"], count=3)
-                for comment in comments:
-                    cleanup_tracker["add"]("comments", comment["id"])
+                cleanup_tracker["add_many"]("comments", [comment["id"] for comment in comments])
         
         # Verify complex tracking
         expected_users = 2
@@ -277,8 +224,8 @@ class TestCleanupTracker:
         assert actual_comments == expected_comments
         assert total_resources == expected_users + expected_posts + expected_comments
         
-        print(f"Test: Complex scenario - users: {actual_users}, posts: {actual_posts}, "
-              f"comments: {actual_comments}, total: {total_resources}")
+        log.debug("Test: Complex scenario - users: %d, posts: %d, comments: %d, total: %d",
+                  actual_users, actual_posts, actual_comments, total_resources)
 
     def test_add_resource(self):
         """Test that a resource is correctly added to the tracker."""
@@ -6,6 +6,12 @@ import pytest
 from pydantic import BaseModel, ValidationError, EmailStr, field_validator
 from typing import Optional
 
+INVALID_FIELDS = (
+    ("id", "not-a-number"),
+    ("email", "invalid-email"),
+    ("name", ""),
+)
+
 class UserModel(BaseModel):
     id: int
     name: str
@@ -34,14 +40,13 @@ class TestDataValidation:
         response = await http_client.get("/users/1")
         assert response.status_code == 200
         
-        user_data = response.json()
-        
         # This will raise ValidationError if data doesn't match schema
-        user = UserModel(**user_data)
+        # (parse + validate in one pass, without building an intermediate dict)
+        user = UserModel.model_validate_json(response.content)
         assert user.id == 1
         assert "@" in user.email
 
-    async def test_invalid_user_data_handling(self, user_factory):
+    def test_invalid_user_data_handling(self, user_factory):
         """Test handling of invalid user data"""
         # Create user with invalid email
         invalid_user = user_factory.create_user(email="invalid-email")
@@ -51,12 +56,9 @@ class TestDataValidation:
         
         assert "email" in str(exc_info.value)
 
-    @pytest.mark.parametrize("field_name,invalid_value", [
-        ("id", "not-a-number"),
-        ("email", "invalid-email"),
-        ("name", ""),
-    ])
-    async def test_field_validation(self, user_factory, field_name, invalid_value):
+    @pytest.mark.parametrize("field_name,invalid_value", INVALID_FIELDS,
+                             ids=[field for field, _ in INVALID_FIELDS])
+    def test_field_validation(self, user_factory, field_name, invalid_value):
         """Test individual field validation"""
         user_data = user_factory.create_user(**{field_name: invalid_value})
         
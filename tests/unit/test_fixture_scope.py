@@ -6,17 +6,20 @@ import pytest
 
 @pytest.fixture(scope="function")
 def function_obj():
-    obj = object()
-    print(f"function_obj id: {id(obj)}")
-    return obj
+    return object()
 
 @pytest.fixture(scope="session")
 def session_obj():
-    obj = object()
-    print(f"session_obj id: {id(obj)}")
-    return obj
+    return {}
+
+@pytest.fixture(scope="class")
+def class_obj():
+    return object()
 
 class TestFixtureScope:
+    # class_obj zoals de vorige test in deze class het kreeg
+    seen = {}
+
     def test_function_scope_1(self, function_obj):
         """Test dat function-scope fixture uniek is per test."""
         pass
@@ -26,13 +29,21 @@ class TestFixtureScope:
         pass
 
     def test_session_scope_1(self, session_obj):
-        """Test dat session-scope fixture gedeeld wordt tussen tests."""
-        pass
+        """Test dat session-scope fixture gedeeld wordt tussen tests (schrijft een waarde)."""
+        session_obj["written_by"] = "test_session_scope_1"
 
     def test_session_scope_2(self, session_obj):
-        """Test dat session-scope fixture gedeeld wordt tussen tests (tweede test)."""
-        pass
+        """Test dat session-scope fixture gedeeld wordt tussen tests (leest de waarde van de eerste test)."""
+        if "written_by" not in session_obj:
+            pytest.skip("test_session_scope_1 draaide niet in deze run")
+        assert session_obj["written_by"] == "test_session_scope_1"
+
+    def test_class_scope_1(self, class_obj):
+        """Test dat class-scope fixture binnen de class gedeeld wordt (onthoudt het object)."""
+        self.seen["class_obj"] = class_obj
 
-    def test_session_scope_3(self, session_obj):
-        """Test dat session-scope fixture gedeeld wordt tussen tests (derde test)."""
-        pass 
\ No newline at end of file
+    def test_class_scope_2(self, class_obj):
+        """Test dat class-scope fixture binnen de class gedeeld wordt (zelfde object als de eerste test)."""
+        if "class_obj" not in self.seen:
+            pytest.skip("test_class_scope_1 draaide niet in deze run")
+        assert class_obj is self.seen["class_obj"]
@@ -11,14 +11,14 @@ def async_parametrize(*args, **kwargs):
 # Performance testing decorator
 def performance_test(max_time: float = 5.0):
     """Decorator for performance testing of async functions."""
+    max_ns = int(max_time * 1e9)
     def decorator(func):
         @pytest.mark.asyncio
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             result = await func(*args, **kwargs)
-            end_time = time.time()
-            execution_time = end_time - start_time
-            assert execution_time < max_time, f"Test took {execution_time:.3f}s, expected < {max_time}s"
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            assert elapsed_ns < max_ns, f"Test took {elapsed_ns / 1e9:.3f}s, expected < {max_time}s"
             return result
         return wrapper
     return decorator 
\ No newline at end of file
@@ -6,6 +6,26 @@ import pytest
 from pydantic import BaseModel, EmailStr, ValidationError, field_validator
 from typing import Optional
 
+INVALID_EMAILS = (
+    "not-an-email",
+    "missing-at-sign.com",
+    "@missing-local.org",
+    "user@.com",
+    "user@domain",
+)
+INVALID_NAMES = (
+    ("a", "Name must be at least 2 characters long"),
+    ("123", "Name must contain only letters and spaces"),
+    ("John123", "Name must contain only letters and spaces"),
+    ("", "Name must be at least 2 characters long"),
+)
+INVALID_AGES = (
+    (-1, "Age must be between 0 and 150"),
+    (151, "Age must be between 0 and 150"),
+    (-100, "Age must be between 0 and 150"),
+    (200, "Age must be between 0 and 150"),
+)
+
 class UserModel(BaseModel):
     id: int
     name: str
@@ -22,7 +42,8 @@ class AdvancedUserModel(BaseModel):
     def name_must_be_valid(cls, v):
         if len(v) < 2:
             raise ValueError('Name must be at least 2 characters long')
-        if not v.replace(' ', '').isalpha():
+        # Snelle route zonder kopie voor namen zonder spaties; isalpha() blijft unicode-letters accepteren
+        if not (v.isalpha() or v.replace(' ', '').isalpha()):
             raise ValueError('Name must contain only letters and spaces')
         # Normalize whitespace and apply title case
         return ' '.join(v.split()).title()
@@ -35,25 +56,24 @@ class AdvancedUserModel(BaseModel):
                 raise ValueError('Age must be between 0 and 150')
         return v
 
+@pytest.fixture(scope="module", autouse=True)
+def _warm_pydantic():
+    """Eenmalige warm-up: validators en email-validator zijn geladen voor de eerste test"""
+    UserModel.model_validate({"id": 0, "name": "x", "email": "a@example.com"})
+    AdvancedUserModel.model_validate({"id": 0, "name": "Xx", "email": "a@example.com"})
+
 class TestPydanticEmailStr:
     def test_valid_email(self):
         """Test dat een geldig e-mailadres wordt geaccepteerd door het model."""
         user = UserModel(id=1, name="Alice", email="alice@example.com")
         assert user.email == "alice@example.com"
 
-    @pytest.mark.parametrize("invalid_email", [
-        "not-an-email",
-        "missing-at-sign.com",
-        "@missing-local.org",
-        "user@.com",
-        "user@domain"
-    ])
-    def test_invalid_email(self, invalid_email):
-        """Test dat ongeldige e-mailadressen een ValidationError geven."""
-        with pytest.raises(ValidationError) as exc_info:
-            UserModel(id=1, name="Bob", email=invalid_email)
-        print(f"Validation error for '{invalid_email}': {exc_info.value}")
-        assert "email" in str(exc_info.value)
+    def test_invalid_emails_batch(self):
+        """Test dat ongeldige e-mailadressen een ValidationError geven (alle gevallen in een test)."""
+        for invalid_email in INVALID_EMAILS:
+            with pytest.raises(ValidationError) as exc_info:
+                UserModel(id=1, name="Bob", email=invalid_email)
+            assert "email" in str(exc_info.value), invalid_email
 
     def test_advanced_user_validation_valid(self):
         """Test advanced user model met custom validators"""
@@ -67,40 +87,28 @@ class TestPydanticEmailStr:
         assert user.email == "john.doe@example.com"
         assert user.age == 25
 
-    @pytest.mark.parametrize("invalid_name,expected_error", [
-        ("a", "Name must be at least 2 characters long"),
-        ("123", "Name must contain only letters and spaces"),
-        ("John123", "Name must contain only letters and spaces"),
-        ("", "Name must be at least 2 characters long"),
-    ])
-    def test_invalid_names(self, invalid_name, expected_error):
-        """Test custom name validation"""
-        with pytest.raises(ValidationError) as exc_info:
-            AdvancedUserModel(
-                id=1,
-                name=invalid_name,
-                email="test@example.com"
-            )
-        print(f"Name validation error for '{invalid_name}': {exc_info.value}")
-        assert expected_error in str(exc_info.value)
+    def test_invalid_names_batch(self):
+        """Test custom name validation (alle gevallen in een test)"""
+        for invalid_name, expected_error in INVALID_NAMES:
+            with pytest.raises(ValidationError) as exc_info:
+                AdvancedUserModel(
+                    id=1,
+                    name=invalid_name,
+                    email="test@example.com"
+                )
+            assert expected_error in str(exc_info.value), repr(invalid_name)
 
-    @pytest.mark.parametrize("invalid_age,expected_error", [
-        (-1, "Age must be between 0 and 150"),
-        (151, "Age must be between 0 and 150"),
-        (-100, "Age must be between 0 and 150"),
-        (200, "Age must be between 0 and 150"),
-    ])
-    def test_invalid_ages(self, invalid_age, expected_error):
-        """Test custom age validation"""
-        with pytest.raises(ValidationError) as exc_info:
-            AdvancedUserModel(
-                id=1,
-                name="John Doe",
-                email="test@example.com",
-                age=invalid_age
-            )
-        print(f"Age validation error for {invalid_age}: {exc_info.value}")
-        assert expected_error in str(exc_info.value)
+    def test_invalid_ages_batch(self):
+        """Test custom age validation (alle gevallen in een test)"""
+        for invalid_age, expected_error in INVALID_AGES:
+            with pytest.raises(ValidationError) as exc_info:
+                AdvancedUserModel(
+                    id=1,
+                    name="John Doe",
+                    email="test@example.com",
+                    age=invalid_age
+                )
+            assert expected_error in str(exc_info.value), invalid_age
 
     def test_optional_age(self):
         """Test dat age optioneel is"""
@@ -122,7 +130,6 @@ class TestPydanticEmailStr:
             )
         
         error_str = str(exc_info.value)
-        print(f"Multiple validation errors: {error_str}")
         
         # Controleer dat alle verwachte fouten aanwezig zijn
         assert "Name must be at least 2 characters long" in error_str